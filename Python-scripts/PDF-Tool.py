@@ -63,9 +63,11 @@
 #    E. Output Optimization
 #       - **Compression**: Optional "Garbage Collection" and stream deflation via PyMuPDF.
 #       - **Tiled Watermark**: Optional diagonal text overlay across the entire page.
+#       - **Stamp First Page Only**: Stamp sets go on the first output page; the rest are copied as is
+#         (custom items and the tiled watermark still apply where placed).
 #
 #    F. System Integration
-#       - **Dependency Management**: Auto-installs `pymupdf`, `pypdf`, `reportlab`, `pillow`.
+#       - **Dependency Management**: Auto-installs `pymupdf`, `reportlab`, `pillow`.
 #       - **Proxy Support**: Respects system env vars and `--proxy` arg for pip installs.
 #       - **Configuration**: Persists UI state to `settings.json`.
 #       - **Build Ready**: Includes `build_executable()` function for PyInstaller.
@@ -75,23 +77,23 @@
 #    Logic:
 #      - Installs PyInstaller if missing.
 #      - Runs: pyinstaller --noconfirm --onedir --windowed --name "PDF_Tools"
-#        --hidden-import pypdf --hidden-import reportlab --hidden-import fitz 
+#        --hidden-import reportlab --hidden-import fitz 
 #        --hidden-import PIL --hidden-import tkinter --clean pdfstamp.py
 # --------------------------------------------------------------------------------
 
 import sys
 import subprocess
 import os
-import importlib
+import importlib.util
 import io
 import json
-import shutil
 import time
 import secrets
 import string
 import math
-import glob
 import copy
+import functools
+import threading
 
 # --- CONFIGURATION ---
 TITLEBAR = "PDF Tools"
@@ -111,38 +113,36 @@ if "--proxy" in sys.argv:
     except: pass
 
 # --- 1. Auto-Installation Logic ---
-def install_and_import(package_name, import_name=None, proxy=None):
-    if import_name is None: import_name = package_name
+def install_missing(packages, proxy=None):
+    # packages: [(pip name, import name)]. find_spec only locates a module, so
+    # nothing is imported twice; the real imports follow in section 3.
+    missing = [pkg for pkg, mod in packages if mod not in sys.modules and importlib.util.find_spec(mod) is None]
+    if not missing: return
+    names = ", ".join(missing)
+    print(f"[INFO] Missing module(s). Installing '{names}'...")
+    # One pip run for everything missing (pip's own startup is the slow part)
+    cmd = [sys.executable, "-m", "pip", "install", *missing]
+    if not proxy:
+        proxy = os.environ.get('http_proxy') or os.environ.get('https_proxy')
+    if proxy: 
+        cmd.extend(["--proxy", proxy])
+        print(f"       Using proxy: {proxy}")
     try:
-        importlib.import_module(import_name)
-    except ImportError:
-        print(f"[INFO] Module '{import_name}' not found. Installing '{package_name}'...")
-        cmd = [sys.executable, "-m", "pip", "install", package_name]
-        if not proxy:
-            proxy = os.environ.get('http_proxy') or os.environ.get('https_proxy')
-        if proxy: 
-            cmd.extend(["--proxy", proxy])
-            print(f"       Using proxy: {proxy}")
-        try:
-            subprocess.check_call(cmd)
-            print(f"[SUCCESS] Installed {package_name}")
-        except subprocess.CalledProcessError: 
-            print(f"[ERROR] Failed to install {package_name}. Check connection.")
-            sys.exit(1)
+        subprocess.check_call(cmd)
+        importlib.invalidate_caches()
+        print(f"[SUCCESS] Installed {names}")
+    except subprocess.CalledProcessError: 
+        print(f"[ERROR] Failed to install {names}. Check connection.")
+        sys.exit(1)
 
 # --- 2. Install Dependencies ---
-install_and_import("pymupdf", "fitz", PROXY_URL)
-install_and_import("pypdf", proxy=PROXY_URL)
-install_and_import("reportlab", proxy=PROXY_URL)
-install_and_import("Pillow", "PIL", PROXY_URL)
+install_missing([("pymupdf", "fitz"), ("reportlab", "reportlab"), ("Pillow", "PIL")], PROXY_URL)
 
 # --- 3. Imports ---
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog, colorchooser, font
 from PIL import Image, ImageTk, ImageFont, ImageDraw, ImageOps
 import fitz
-from pypdf import PdfReader, PdfWriter, PageObject
-from pypdf.constants import UserAccessPermissions
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import HexColor
 from reportlab.pdfbase import pdfmetrics
@@ -150,7 +150,7 @@ from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.utils import ImageReader
 
 # --- 4. Font Registration ---
-REGISTERED_FONTS = []
+REGISTERED_FONTS = [] # Found on this machine; the TTF/TTC is parsed on first use (ensure_font)
 SYSTEM_FONT_MAP = {} 
 
 def register_fonts():
@@ -163,31 +163,85 @@ def register_fonts():
         ("CN-SimHei", ["simhei.ttf"]), 
         ("Arial-Unicode", ["arialuni.ttf"])
     ]
-    for name, fnames in priority:
-        for d in dirs:
-            for fn in fnames:
-                fp = os.path.join(d, fn)
-                if os.path.exists(fp):
-                    try: 
-                        pdfmetrics.registerFont(TTFont(name, fp))
-                        REGISTERED_FONTS.append(name)
-                        SYSTEM_FONT_MAP[name] = fp
-                        break 
-                    except: pass
-            if name in REGISTERED_FONTS: break
-
+    # One directory listing per font dir (lowercase file name -> path) instead of a stat per candidate
+    listings = []
     for d in dirs:
-        if os.path.exists(d):
-            for fp in glob.glob(os.path.join(d, "*.ttf")):
-                fn = os.path.basename(fp)
-                name = fn.split(".")[0].replace("-", " ").title()
+        try: listings.append({e.name.lower(): e.path for e in os.scandir(d) if e.is_file()})
+        except OSError: pass
+
+    for name, fnames in priority:
+        fp = next((files[fn] for files in listings for fn in fnames if fn in files), None)
+        if fp:
+            REGISTERED_FONTS.append(name)
+            SYSTEM_FONT_MAP[name] = fp
+
+    for files in listings:
+        for lower_fn, fp in files.items():
+            if lower_fn.endswith(".ttf"):
+                name = os.path.basename(fp).split(".")[0].replace("-", " ").title()
                 if name not in SYSTEM_FONT_MAP:
                     SYSTEM_FONT_MAP[name] = fp
 register_fonts()
 
+@functools.lru_cache(maxsize=None)
+def ensure_font(name):
+    # reportlab reads the whole font file (several MB for the CJK ones), so pay for it
+    # when a font is first drawn instead of for every font at startup
+    if name not in REGISTERED_FONTS: return False
+    try: pdfmetrics.registerFont(TTFont(name, SYSTEM_FONT_MAP[name]))
+    except Exception: return False
+    return True
+
+# Preview redraws measure the same strings and parse the same colours every time
+_string_width = functools.lru_cache(maxsize=512)(pdfmetrics.stringWidth)
+_hex_color = functools.lru_cache(maxsize=64)(HexColor)
+
+# (family, style) from the Stamp Tab combos -> built-in PDF font name
+STANDARD_FONTS = {
+    ("Helvetica", "Regular"): "Helvetica", ("Helvetica", "Bold"): "Helvetica-Bold",
+    ("Helvetica", "Italic"): "Helvetica-Oblique", ("Helvetica", "BoldItalic"): "Helvetica-BoldOblique",
+    ("Times-Roman", "Regular"): "Times-Roman", ("Times-Roman", "Bold"): "Times-Bold",
+    ("Times-Roman", "Italic"): "Times-Italic", ("Times-Roman", "BoldItalic"): "Times-BoldItalic",
+    ("Courier", "Regular"): "Courier", ("Courier", "Bold"): "Courier-Bold",
+    ("Courier", "Italic"): "Courier-Oblique", ("Courier", "BoldItalic"): "Courier-BoldOblique",
+}
+
+# Preview-only resampling: BILINEAR is several times cheaper than LANCZOS and indistinguishable at screen size
+PREVIEW_RESAMPLE = Image.Resampling.BILINEAR
+
+# --- 4b. Stamp Geometry ---
+# Stamp centre per position id: (page w, page h, edge margin, rotated box w, rotated box h) -> (cx, cy).
+# Corners sit 10% in from the sides; side positions align the rotated box edge to the margin.
+STAMP_ANCHORS = {
+    "TL": lambda w, h, m, rw, rh: (w*0.10 + rw/2, h - m - rh/2),
+    "TC": lambda w, h, m, rw, rh: (w/2, h - m - rh/2),
+    "TR": lambda w, h, m, rw, rh: (w - w*0.10 - rw/2, h - m - rh/2),
+    "LT": lambda w, h, m, rw, rh: (m + rw/2, h - m - rh/2),
+    "RT": lambda w, h, m, rw, rh: (w - m - rw/2, h - m - rh/2),
+    "LC": lambda w, h, m, rw, rh: (m + rw/2, h/2),
+    "C":  lambda w, h, m, rw, rh: (w/2, h/2),
+    "RC": lambda w, h, m, rw, rh: (w - m - rw/2, h/2),
+    "LB": lambda w, h, m, rw, rh: (m + rw/2, m + rh/2),
+    "RB": lambda w, h, m, rw, rh: (w - m - rw/2, m + rh/2),
+    "BL": lambda w, h, m, rw, rh: (w*0.10 + rw/2, m + rh/2),
+    "BC": lambda w, h, m, rw, rh: (w/2, m + rh/2),
+    "BR": lambda w, h, m, rw, rh: (w - w*0.10 - rw/2, m + rh/2),
+}
+
+@functools.lru_cache(maxsize=256)
+def _stamp_box(nat_w, nat_h, is_center, angle):
+    # Fit the stamp into its slot (larger for the centre), then size the rotated bounding box
+    MAX_W, MAX_H = (300, 200) if is_center else (200, 60)
+    scale = min(1.0, MAX_W/nat_w if nat_w>MAX_W else 1.0, MAX_H/nat_h if nat_h>MAX_H else 1.0)
+    eff_w, eff_h = nat_w * scale, nat_h * scale
+    ang_rad = math.radians(angle)
+    rot_w = abs(eff_w * math.cos(ang_rad)) + abs(eff_h * math.sin(ang_rad))
+    rot_h = abs(eff_w * math.sin(ang_rad)) + abs(eff_h * math.cos(ang_rad))
+    return scale, rot_w, rot_h
+
 # --- 5. Build Automation ---
 def build_executable():
-    install_and_import("pyinstaller", "PyInstaller", PROXY_URL)
+    install_missing([("pyinstaller", "PyInstaller")], PROXY_URL)
     script_name = os.path.basename(__file__)
     exe_name = APPNAME
     
@@ -195,7 +249,6 @@ def build_executable():
         sys.executable, "-m", "PyInstaller", 
         "--noconfirm", "--onedir", "--windowed", 
         "--name", exe_name, 
-        "--hidden-import", "pypdf", 
         "--hidden-import", "reportlab", 
         "--hidden-import", "fitz", 
         "--hidden-import", "PIL", 
@@ -488,6 +541,7 @@ class StampTab(ttk.Frame):
         self.update_callback = update_callback
         self.enabled = tk.BooleanVar(value=default_enabled)
         self.image_path = tk.StringVar(value="")
+        self._img_key_cached = None; self._img_reader = None # (ImageReader, w, h) for _img_key_cached (path, mtime, size)
         
         self.txt_1 = tk.StringVar(value=text_l1); self.sz_1 = tk.IntVar(value=20)
         self.txt_2 = tk.StringVar(value=text_l2); self.sz_2 = tk.IntVar(value=40)
@@ -529,6 +583,7 @@ class StampTab(ttk.Frame):
         ttk.Label(tg, text="Content").grid(row=0,column=0); ttk.Label(tg, text="Size").grid(row=0,column=1); ttk.Label(tg, text="Align").grid(row=0,column=2)
         for i, (tv, sv, av) in enumerate([(self.txt_1, self.sz_1, self.align_1), (self.txt_2, self.sz_2, self.align_2), (self.txt_3, self.sz_3, self.align_3)]):
             ttk.Entry(tg, textvariable=tv).grid(row=i+1, column=0, sticky="ew")
+            tv.trace_add("write", lambda *a: self.update_callback()) # Typing re-renders (debounced by the app)
             ttk.Spinbox(tg, from_=1, to=200, textvariable=sv, width=4, command=self.update_callback).grid(row=i+1, column=1)
             cb = ttk.Combobox(tg, textvariable=av, values=("Left", "Center", "Right"), width=7, state="readonly"); cb.grid(row=i+1, column=2)
             cb.bind("<<ComboboxSelected>>", lambda e: self.update_callback())
@@ -577,6 +632,7 @@ class StampTab(ttk.Frame):
     def select_image(self):
         f = filedialog.askopenfilename(filetypes=[("PNG Image", "*.png")])
         if f: 
+            self._img_key_cached = None # Re-read even if the same file was picked again (it may have been edited)
             self.image_path.set(f)
             self.lbl_img_path.configure(text=os.path.basename(f), foreground="black")
             self.update_callback()
@@ -586,6 +642,25 @@ class StampTab(ttk.Frame):
         self.lbl_img_path.configure(text="No image", foreground="gray")
         self.update_callback()
     
+    def image_key(self):
+        # Path plus modification time and size, so an edited logo saved under the same name counts as a new image
+        path = self.image_path.get()
+        try: st = os.stat(path); return (path, st.st_mtime_ns, st.st_size)
+        except OSError: return (path, None, None)
+
+    def get_image_reader(self):
+        # ImageReader decodes the file, so keep it for every page and preview refresh until the file changes
+        key = self.image_key()
+        if key != self._img_key_cached:
+            path = key[0]
+            self._img_key_cached, self._img_reader = key, None
+            if path and os.path.exists(path):
+                try:
+                    reader = ImageReader(path)
+                    self._img_reader = (reader,) + tuple(reader.getSize())
+                except: pass
+        return self._img_reader
+
     def set_hex(self, h): self.col_hex=h; self.lbl_sw.config(bg=h); self.update_callback()
     def apply_rgb(self):
         try: r,g,b = self.col_r.get(), self.col_g.get(), self.col_b.get(); self.col_hex=f"#{r:02x}{g:02x}{b:02x}"; self.lbl_sw.config(bg=self.col_hex); self.update_callback()
@@ -605,6 +680,16 @@ class StampTab(ttk.Frame):
             "bd": self.border.get(), "bs": self.border_style.get(), "col": self.col_hex, 
             "pos": p_d, "margin": self.margin_var.get()
         }
+    def snapshot(self):
+        # Plain values for draw_stamp_layer, so drawing the stamp for each page size makes no Tcl calls
+        d = self.get_settings_dict()
+        return {
+            "settings": d, "enabled": d["en"], "image": self.get_image_reader(), "image_key": self._img_key_cached,
+            "lines": [(d["t1"], d["s1"], d["a1"]), (d["t2"], d["s2"], d["a2"]), (d["t3"], d["s3"], d["a3"])],
+            "fam": d["fam"], "sty": d["sty"], "opac": d["op"] / 100.0, "col": d["col"], "margin": d["margin"],
+            "active": [(pid, int(d["pos"][pid]["rot"])) for pid in self.pos_map if d["pos"][pid]["en"]],
+            "border_dash": {"Dotted": [2, 2], "Dashed": [6, 3]}.get(d["bs"], []) if d["bd"] else None
+        }
     def load_settings_dict(self, d):
         if not d: return
         try:
@@ -631,11 +716,13 @@ class PDFWatermarkApp:
         
         self.input_file = None; self.doc_ref = None
         self.current_page_idx = 0; self.total_pages = 0; self.tk_img = None
+        self._preview_item = None # Canvas image item showing tk_img; reused while the preview size stays the same
         self.page_mapping = [] 
         
         # UI Vars
         self.compress_var = tk.BooleanVar(value=False)
         self.open_file_var = tk.BooleanVar(value=True)
+        self.first_page_only_var = tk.BooleanVar(value=False)
         self.input_password = None 
 
         # Custom Elements Storage
@@ -655,6 +742,25 @@ class PDFWatermarkApp:
         self.initial_item_vals = {} 
         self.dragging_in_progress = False 
 
+        # Preview Debounce
+        self._pending_preview = None
+        self.PREVIEW_DELAY_MS = 50        # Canvas drags: keep the item following the mouse
+        self.PREVIEW_EDIT_DELAY_MS = 120  # Stamp settings / typing / window resize
+        self._wm_buf = io.BytesIO() # Reused by every stamp PDF build
+        self._wm_cache = {} # (page w, page h, stamp settings) -> stamp PDF bytes, shared by preview and save
+        self.WM_CACHE_SIZE = 8
+        self._base_cache = {} # (real page idx, zoom) -> rasterized page on white (RGBA); cleared when the document changes
+        self.BASE_CACHE_PAGES = 4
+        self.PREVIEW_MIN_ZOOM = 0.25 # Pixels per PDF point for the preview raster
+        self.PREVIEW_MAX_ZOOM = 4.0
+        self._stamp_cache = None # (settings/page-size key, rendered stamp layer)
+        self._composite_cache = None # ((real page idx, zoom, stamp key), base with the stamp layer blended in)
+        # Background render: one worker at a time holds _render_lock while it uses doc_ref and the caches
+        self._render_lock = threading.Lock()
+        self._render_cancel = threading.Event() # Set (and replaced) when the document changes
+        self._render_job = None
+        self._render_thread = None
+
         self._setup_ui()
         self.load_settings()
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -687,14 +793,15 @@ class PDFWatermarkApp:
         self.lbl_file = ttk.Label(f_frame, text="No file loaded", foreground="gray"); self.lbl_file.pack(fill=tk.X)
 
         self.nb = ttk.Notebook(left); self.nb.pack(fill=tk.BOTH, expand=True, pady=2)
-        self.tab1 = StampTab(self.nb, self.update_preview, "", "Confidential", True)
-        self.tab2 = StampTab(self.nb, self.update_preview, "", "Copy", False)
-        self.tab3 = StampTab(self.nb, self.update_preview, "", "Draft", False)
+        self.tab1 = StampTab(self.nb, self._schedule_edit_preview, "", "Confidential", True)
+        self.tab2 = StampTab(self.nb, self._schedule_edit_preview, "", "Copy", False)
+        self.tab3 = StampTab(self.nb, self._schedule_edit_preview, "", "Draft", False)
         self.nb.add(self.tab1, text=" Stamp Set 1 "); self.nb.add(self.tab2, text=" Stamp Set 2 "); self.nb.add(self.tab3, text=" Stamp Set 3 ")
 
         act = ttk.LabelFrame(left, text="Actions", padding=2); act.pack(fill=tk.X, pady=2)
         ttk.Checkbutton(act, text="Compress Output (Smaller File Size)", variable=self.compress_var).pack(anchor="w", pady=(0,2))
         ttk.Checkbutton(act, text="Open File after Save", variable=self.open_file_var).pack(anchor="w", pady=(0,2))
+        ttk.Checkbutton(act, text="Stamp First Page Only", variable=self.first_page_only_var, command=self._schedule_preview).pack(anchor="w", pady=(0,2))
         
         ttk.Button(act, text="Refresh Preview", command=self.update_preview).pack(fill=tk.X, pady=1)
         ttk.Button(act, text="Save Settings", command=self.save_settings).pack(fill=tk.X, pady=1)
@@ -746,7 +853,7 @@ class PDFWatermarkApp:
         last_state = self.undo_stack.pop()
         self.custom_overlays = last_state
         self.selected_item_uid = None
-        self.update_preview()
+        self._schedule_preview()
 
     # --- CANVAS INTERACTION LOGIC ---
     def get_item_data_by_uid(self, uid):
@@ -759,7 +866,7 @@ class PDFWatermarkApp:
         clicked_items = self.preview_canvas.find_closest(event.x, event.y)
         if not clicked_items:
             self.selected_item_uid = None
-            self.update_preview()
+            self._schedule_preview()
             return
             
         top_item = clicked_items[0]
@@ -809,11 +916,11 @@ class PDFWatermarkApp:
             data = self.get_item_data_by_uid(uid)
             if data:
                 self.initial_item_vals = {'x': data['x'], 'y': data['y']}
-            self.update_preview()
+            self._schedule_preview()
         else:
             self.selected_item_uid = None
             self.interaction_mode = None
-            self.update_preview()
+            self._schedule_preview()
 
     def on_canvas_drag(self, event):
         if not self.interaction_mode or not self.selected_item_uid: return
@@ -837,7 +944,7 @@ class PDFWatermarkApp:
             data['x'] = self.initial_item_vals['x'] + dx_pdf
             data['y'] = self.initial_item_vals['y'] + dy_pdf
             
-            self.update_preview()
+            self._schedule_preview()
 
         # --- RESIZE LOGIC (RATIO BASED) ---
         elif self.interaction_mode == "RESIZE":
@@ -870,7 +977,7 @@ class PDFWatermarkApp:
                 if new_len < 10: new_len = 10
                 data['len'] = int(new_len)
 
-            self.update_preview()
+            self._schedule_preview()
 
     def on_canvas_release(self, event):
         self.interaction_mode = None
@@ -882,7 +989,7 @@ class PDFWatermarkApp:
         
         if uid:
             self.selected_item_uid = uid
-            self.update_preview()
+            self._schedule_preview()
             menu = tk.Menu(self.root, tearoff=0)
             menu.add_command(label="Delete Item", command=lambda: self.delete_custom_item(uid))
             menu.post(event.x_root, event.y_root)
@@ -893,7 +1000,7 @@ class PDFWatermarkApp:
         if real_idx in self.custom_overlays:
             self.custom_overlays[real_idx] = [x for x in self.custom_overlays[real_idx] if x['uid'] != uid]
             self.selected_item_uid = None
-            self.update_preview()
+            self._schedule_preview()
 
     # --- CUSTOM ITEMS ADD/EDIT ---
     def add_custom_item(self):
@@ -919,7 +1026,7 @@ class PDFWatermarkApp:
         
         self.custom_overlays[real_idx].append(res)
         self.selected_item_uid = new_uid
-        self.update_preview()
+        self._schedule_preview()
 
     def edit_custom_item(self, event):
         if not self.selected_item_uid: return
@@ -935,7 +1042,7 @@ class PDFWatermarkApp:
             # Update dict in place
             for k, v in dlg.result.items():
                 data[k] = v
-            self.update_preview()
+            self._schedule_preview()
 
     def clear_custom_page(self):
         if not self.doc_ref: return
@@ -945,7 +1052,7 @@ class PDFWatermarkApp:
             if real_idx in self.custom_overlays:
                 del self.custom_overlays[real_idx]
             self.selected_item_uid = None
-            self.update_preview()
+            self._schedule_preview()
 
     # --- EXISTING LOAD/NAVIGATE ---
     def load_pdf(self):
@@ -962,6 +1069,7 @@ class PDFWatermarkApp:
                         while True:
                             pwd = simpledialog.askstring("Encrypted PDF", "File is encrypted. Enter Password:", show='*')
                             if not pwd: 
+                                doc.close()
                                 messagebox.showinfo("Cancelled", "Load cancelled.")
                                 return
                             if doc.authenticate(pwd):
@@ -970,13 +1078,12 @@ class PDFWatermarkApp:
                             else:
                                 messagebox.showerror("Error", "Incorrect Password.")
                 
-                if self.doc_ref: self.doc_ref.close()
-                self.doc_ref = doc
+                self._set_document(doc)
                 self.total_pages = self.doc_ref.page_count
                 self.page_mapping = list(range(self.total_pages))
                 self.current_page_idx = 0
                 self.btn_pg.config(state=tk.NORMAL)
-                self.update_preview()
+                self._schedule_preview()
             except Exception as e: messagebox.showerror("Error", str(e))
 
     def open_page_manager(self):
@@ -987,147 +1094,118 @@ class PDFWatermarkApp:
         self.page_mapping = new_mapping
         self.total_pages = len(self.page_mapping)
         self.current_page_idx = 0
-        self.update_preview()
+        self._schedule_preview()
 
     def prev_page(self):
-        if self.current_page_idx > 0: self.current_page_idx -= 1; self.update_preview()
+        if self.current_page_idx > 0: self.current_page_idx -= 1; self._schedule_preview()
     def next_page(self):
-        if self.current_page_idx < self.total_pages - 1: self.current_page_idx += 1; self.update_preview()
+        if self.current_page_idx < self.total_pages - 1: self.current_page_idx += 1; self._schedule_preview()
 
     def get_font_name(self, fam, sty):
-        if fam in REGISTERED_FONTS: return "Tahoma-Bold" if fam=="Tahoma" and "Bold" in sty else fam
-        base = "Helvetica"
-        if fam == "Times-Roman": base = "Times-Roman"
-        elif fam == "Courier": base = "Courier"
-        suffix = ""
-        if "Bold" in sty: suffix += "-Bold"
-        if "Italic" in sty: suffix += "-Oblique" if base in ["Helvetica","Courier"] else "-Italic"
-        full = base + suffix
-        if full == "Times-Roman-Bold": full = "Times-Bold"
-        return full
-
-    def draw_stamp_layer(self, c, tab, w, h, used_positions):
-        opac = tab.opac.get() / 100.0
-        is_image = False
-        img_path = tab.image_path.get()
-        if img_path and os.path.exists(img_path):
-            is_image = True
-            try:
-                img_reader = ImageReader(img_path)
-                iw, ih = img_reader.getSize()
-                nat_w, nat_h = iw, ih
-            except: is_image = False
-        
-        if not is_image:
-            lines = [(tab.txt_1.get(), tab.sz_1.get(), tab.align_1.get()), (tab.txt_2.get(), tab.sz_2.get(), tab.align_2.get()), (tab.txt_3.get(), tab.sz_3.get(), tab.align_3.get())]
-            lines = [(t, s, a) for t, s, a in lines if t.strip()]
-            if not lines: return
-            
-            font_name = self.get_font_name(tab.fam.get(), tab.sty.get())
-            pad = 10; max_w, total_h, line_dims = 0, 0, []
-            for txt, sz, alg in lines:
-                try: c.setFont(font_name, sz)
-                except: c.setFont("Helvetica", sz)
-                lw = c.stringWidth(txt, font_name, sz); lh = sz * 1.2
+        if ensure_font(fam): return "Tahoma-Bold" if fam=="Tahoma" and "Bold" in sty else fam
+        # Families not installed here (e.g. Tahoma from another machine's settings) fall back to Helvetica
+        return STANDARD_FONTS.get((fam, sty)) or STANDARD_FONTS.get(("Helvetica", sty), "Helvetica")
+
+    def _stamp_text_layout(self, snap):
+        # Font and line sizes do not depend on the page, so measure once per snapshot and reuse for every page size
+        layout = snap.get("layout")
+        if layout is None:
+            font_name = self.get_font_name(snap["fam"], snap["sty"])
+            # Resolve the font once for measuring and drawing (e.g. Tahoma-Bold has no registered face)
+            try: pdfmetrics.getFont(font_name)
+            except: font_name = "Helvetica"
+            max_w, total_h, line_dims = 0, 0, []
+            for txt, sz, alg in snap["lines"]:
+                if not txt.strip(): continue
+                lw = _string_width(txt, font_name, sz); lh = sz * 1.2
                 line_dims.append((lw, lh, sz, txt, alg))
                 if lw > max_w: max_w = lw
                 total_h += lh
+            layout = snap["layout"] = (font_name, line_dims, max_w, total_h)
+        return layout
+
+    def draw_stamp_layer(self, c, snap, w, h, used_positions):
+        # snap is StampTab.snapshot()
+        opac = snap["opac"]
+        img = snap["image"]
+        is_image = img is not None
+        if is_image: img_reader, nat_w, nat_h = img
+        
+        if not is_image:
+            font_name, line_dims, max_w, total_h = self._stamp_text_layout(snap)
+            if not line_dims: return
+            pad = 10
             nat_w, nat_h = max_w + pad*2, total_h + pad*2
 
-        try: c.setFillColor(HexColor(tab.col_hex), alpha=opac)
+        try: c.setFillColor(_hex_color(snap["col"]), alpha=opac)
         except: c.setFillColorRGB(0,0,0, alpha=opac)
-        try: c.setStrokeColor(HexColor(tab.col_hex), alpha=opac)
+        try: c.setStrokeColor(_hex_color(snap["col"]), alpha=opac)
         except: pass
 
-        margin = tab.margin_var.get()
-        off_10_w, off_16_h = w*0.10, h*0.16
-        xm, ym = w/2, h/2
-
-        for pid, (lbl, _, r, c_idx) in tab.pos_map.items():
-            if tab.pos_vars[pid].get():
-                if pid in used_positions: continue
-                used_positions.add(pid)
-                angle = int(tab.rot_vars[pid].get())
-                cx, cy = 0, 0
-                if pid == "C": MAX_W, MAX_H = 300, 200
-                else: MAX_W, MAX_H = 200, 60
-                scale = min(1.0, MAX_W/nat_w if nat_w>MAX_W else 1.0, MAX_H/nat_h if nat_h>MAX_H else 1.0)
-                eff_w, eff_h = nat_w * scale, nat_h * scale
-                
-                # --- CALCULATE EDGE COORDINATES (With Margin Logic) ---
-                # Rotate dimensions
-                ang_rad = math.radians(angle)
-                rot_w = abs(eff_w * math.cos(ang_rad)) + abs(eff_h * math.sin(ang_rad))
-                rot_h = abs(eff_w * math.sin(ang_rad)) + abs(eff_h * math.cos(ang_rad))
-
-                # Align bounding box edge to margin
-                y_T_cor = h - margin - rot_h/2
-                y_B_cor = margin + rot_h/2
-                
-                x_L_cor = off_10_w + rot_w/2
-                x_R_cor = w - off_10_w - rot_w/2
-                
-                x_L_side = margin + rot_w/2 
-                x_R_side = w - margin - rot_w/2
-                
-                y_S_top = h - off_16_h
-                y_S_bot = off_16_h
+        margin = snap["margin"]
+        border_dash = None if is_image else snap["border_dash"]
 
-                if pid=="TL": cx,cy = x_L_cor, y_T_cor
-                elif pid=="TC": cx,cy = xm, y_T_cor
-                elif pid=="TR": cx,cy = x_R_cor, y_T_cor
-                
-                # --- Advanced Side Positioning (Alignment to End/Start) ---
-                elif pid in ["LT", "RT"]:
-                    # Align Top Edge of text box to (h - margin)
-                    cy = h - margin - (rot_h / 2)
-                    if pid == "LT": cx = x_L_side
-                    else: cx = x_R_side
-
-                elif pid in ["LB", "RB"]:
-                    # Align Bottom Edge of text box to (margin)
-                    cy = margin + (rot_h / 2)
-                    if pid == "LB": cx = x_L_side
-                    else: cx = x_R_side
-
-                elif pid=="LC": cx,cy = x_L_side, ym
-                elif pid=="RC": cx,cy = x_R_side, ym
-                elif pid=="BL": cx,cy = x_L_cor, y_B_cor
-                elif pid=="BC": cx,cy = xm, y_B_cor
-                elif pid=="BR": cx,cy = x_R_cor, y_B_cor
-                elif pid=="C":  cx,cy = xm, ym
-
-                c.saveState()
-                c.translate(cx, cy); c.rotate(angle); c.scale(scale, scale)
-                
-                if is_image:
-                    c.setFillAlpha(opac); c.drawImage(img_reader, -nat_w/2, -nat_h/2, nat_w, nat_h, mask='auto')
-                else:
-                    if tab.border.get():
-                        bs = tab.border_style.get()
-                        if bs == "Dotted": c.setDash([2, 2])
-                        elif bs == "Dashed": c.setDash([6, 3])
-                        else: c.setDash([])
-                        c.rect(-nat_w/2, -nat_h/2, nat_w, nat_h, fill=0)
-                    cur_y = (total_h / 2) 
-                    for (lw, lh, sz, txt, alg) in line_dims:
-                        try: c.setFont(font_name, sz)
-                        except: c.setFont("Helvetica", sz)
-                        dy = cur_y - (sz * 0.95)
-                        dx = 0
-                        if alg == "Left": dx = -max_w/2
-                        elif alg == "Right": dx = max_w/2 - lw
-                        if alg == "Center": c.drawCentredString(0, dy, txt)
-                        else: c.drawString(dx, dy, txt)
-                        cur_y -= lh 
-                c.restoreState()
-
-    def get_combined_watermark(self, w, h):
-        packet = io.BytesIO()
+        for pid, angle in snap["active"]:
+            if pid in used_positions: continue
+            used_positions.add(pid)
+            # Scale and rotated box only depend on the stamp size and angle; the edge/margin alignment is a table lookup
+            scale, rot_w, rot_h = _stamp_box(nat_w, nat_h, pid == "C", angle)
+            cx, cy = STAMP_ANCHORS[pid](w, h, margin, rot_w, rot_h)
+
+            c.saveState()
+            c.translate(cx, cy); c.rotate(angle); c.scale(scale, scale)
+            
+            if is_image:
+                c.setFillAlpha(opac); c.drawImage(img_reader, -nat_w/2, -nat_h/2, nat_w, nat_h, mask='auto')
+            else:
+                if border_dash is not None:
+                    c.setDash(border_dash)
+                    c.rect(-nat_w/2, -nat_h/2, nat_w, nat_h, fill=0)
+                cur_y = (total_h / 2) 
+                for (lw, lh, sz, txt, alg) in line_dims:
+                    c.setFont(font_name, sz)
+                    dy = cur_y - (sz * 0.95)
+                    dx = 0
+                    if alg == "Left": dx = -max_w/2
+                    elif alg == "Right": dx = max_w/2 - lw
+                    if alg == "Center": c.drawCentredString(0, dy, txt)
+                    else: c.drawString(dx, dy, txt)
+                    cur_y -= lh 
+            c.restoreState()
+
+    def _apply_overlay(self, page, ov):
+        # show_pdf_page works in unrotated space; turning the overlay with the page keeps it upright as displayed
+        if ov.page_count > 0:
+            page.show_pdf_page(page.rect * page.derotation_matrix, ov, 0, rotate=page.rotation)
+
+    def _stamp_state(self):
+        # (cache key, tab snapshots): one read of the stamp tabs, shared by every page size of a save or preview
+        snaps = [t.snapshot() for t in (self.tab1, self.tab2, self.tab3)]
+        # image_key makes an edited logo file miss the stamp caches, even though its path is unchanged
+        return json.dumps([[sn["settings"], sn["image_key"]] for sn in snaps], sort_keys=True), snaps
+
+    def get_watermark_bytes(self, w, h, state=None):
+        # The stamp PDF only depends on the page size and the stamp settings: zoom changes just re-raster it,
+        # and a save reuses what the preview already built for the same page size
+        if state is None: state = self._stamp_state()
+        settings, snaps = state
+        key = (round(w, 2), round(h, 2), settings)
+        pdf = self._wm_cache.get(key)
+        if pdf is None:
+            pdf = self.get_combined_watermark(w, h, self._wm_buf, snaps).getvalue()
+            if len(self._wm_cache) >= self.WM_CACHE_SIZE: self._wm_cache.pop(next(iter(self._wm_cache)))
+            self._wm_cache[key] = pdf
+        return pdf
+
+    def get_combined_watermark(self, w, h, packet=None, snaps=None):
+        # get_watermark_bytes passes its reusable buffer, since it keeps only the bytes
+        if packet is None: packet = io.BytesIO()
+        else: packet.seek(0); packet.truncate()
+        if snaps is None: snaps = [t.snapshot() for t in (self.tab1, self.tab2, self.tab3)]
         c = canvas.Canvas(packet, pagesize=(w, h))
         used = set()
-        for tab in [self.tab1, self.tab2, self.tab3]:
-            if tab.enabled.get(): self.draw_stamp_layer(c, tab, w, h, used)
+        for snap in snaps:
+            if snap["enabled"]: self.draw_stamp_layer(c, snap, w, h, used)
         c.save()
         packet.seek(0)
         return packet
@@ -1135,7 +1213,7 @@ class PDFWatermarkApp:
     def get_overlay_watermark(self, text, w, h):
         packet = io.BytesIO()
         c = canvas.Canvas(packet, pagesize=(w, h))
-        try: c.setFont("Tahoma", 14)
+        try: ensure_font("Tahoma"); c.setFont("Tahoma", 14)
         except: c.setFont("Helvetica-Bold", 14)
         c.setFillColorRGB(0.6, 0.6, 0.6, alpha=0.3) 
         c.saveState()
@@ -1151,12 +1229,65 @@ class PDFWatermarkApp:
         return packet
     
     def on_canvas_resize(self, event):
-        if self.doc_ref: self.update_preview()
+        if self.doc_ref: self._schedule_edit_preview()
+
+    # --- PREVIEW DEBOUNCE ---
+    def _schedule_preview(self, delay_ms=None):
+        # Collapse bursts of widget events (spin/drag/resize) into one render
+        if self._pending_preview: self.root.after_cancel(self._pending_preview)
+        self._pending_preview = self.root.after(delay_ms or self.PREVIEW_DELAY_MS, self._do_preview)
+
+    def _schedule_edit_preview(self):
+        # Settings edits and resizes come in longer bursts, so wait a little longer for them to settle
+        self._schedule_preview(self.PREVIEW_EDIT_DELAY_MS)
+
+    def _do_preview(self):
+        self._pending_preview = None
+        self.update_preview()
+
+    def _set_document(self, doc):
+        # Drop in-flight preview renders of the old document, then swap it once the render thread lets go
+        self._render_cancel.set()
+        self._render_cancel = threading.Event()
+        with self._render_lock:
+            if self.doc_ref: self.doc_ref.close()
+            self.doc_ref = doc
+            self._base_cache.clear()
+            self._composite_cache = None
+
+    def _get_base_image(self, real_page_idx, zoom):
+        # Stamp/item edits do not change the page itself, so only re-rasterize on a new page or zoom
+        key = (real_page_idx, zoom)
+        bg = self._base_cache.get(key)
+        if bg is None:
+            page = self.doc_ref.load_page(real_page_idx)
+            # Without alpha MuPDF renders straight onto white, so no compositing over a white layer is needed
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            # samples_mv avoids copying the pixels into a bytes object; convert() makes the owned RGBA image
+            bg = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", 0, 1).convert("RGBA")
+            if len(self._base_cache) >= self.BASE_CACHE_PAGES: self._base_cache.pop(next(iter(self._base_cache)))
+            self._base_cache[key] = bg
+        return bg
+
+    def _raster_stamp(self, stamp_pdf, zoom, size):
+        wm_doc = fitz.open("pdf", stamp_pdf)
+        wm_img = None
+        if wm_doc.page_count > 0:
+            wm_pix = wm_doc.load_page(0).get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=True)
+            # An RGBA frombuffer image shares the pixmap memory: take one owned copy (or the resize) and drop the view
+            shared = Image.frombuffer("RGBA", (wm_pix.width, wm_pix.height), wm_pix.samples_mv, "raw", "RGBA", 0, 1)
+            wm_img = shared.resize(size, PREVIEW_RESAMPLE) if shared.size != size else shared.copy()
+            del shared
+        wm_doc.close()
+        return wm_img
 
     def update_preview(self):
-        self.preview_canvas.delete("all")
-        self.canvas_images = [] 
-        if not self.doc_ref or not self.page_mapping: return
+        # Main thread: snapshot everything that reads Tk state or may change mid-render, then hand off to a worker
+        if not self.doc_ref or not self.page_mapping:
+            self.preview_canvas.delete("all")
+            self.canvas_images = []
+            self._preview_item = None
+            return
         
         if self.current_page_idx >= len(self.page_mapping): self.current_page_idx = 0
             
@@ -1164,39 +1295,81 @@ class PDFWatermarkApp:
             real_page_idx = self.page_mapping[self.current_page_idx]
             if real_page_idx >= self.doc_ref.page_count: return 
 
-            page = self.doc_ref.load_page(real_page_idx)
-            
-            # Base PDF Render (using PyMuPDF)
-            pix = page.get_pixmap(matrix=fitz.Matrix(2,2), alpha=True)
-            mode = "RGBA" if pix.alpha else "RGB"
-            bg = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-            if mode=="RGBA": bg = Image.alpha_composite(Image.new("RGBA", bg.size, (255,255,255,255)), bg)
-
-            # Standard Stamp Render (ReportLab)
-            pkt = self.get_combined_watermark(page.rect.width, page.rect.height)
-            wm_doc = fitz.open("pdf", pkt.getvalue())
+            rect = self.doc_ref.load_page(real_page_idx).rect
             
-            if wm_doc.page_count > 0:
-                wm_pix = wm_doc.load_page(0).get_pixmap(matrix=fitz.Matrix(2,2), alpha=True)
-                wm_img = Image.frombytes("RGBA", [wm_pix.width, wm_pix.height], wm_pix.samples)
-                if wm_img.size != bg.size: wm_img = wm_img.resize(bg.size, Image.Resampling.LANCZOS)
-                final = Image.alpha_composite(bg.convert("RGBA"), wm_img)
-            else:
-                final = bg.convert("RGBA")
-            
-            # --- CUSTOM ITEMS LAYER (using PIL) ---
-            overlay = Image.new("RGBA", final.size, (255,255,255,0))
-            draw = ImageDraw.Draw(overlay)
+            # Raster once at the size shown on the canvas (pixels per PDF point), instead of at 2x and downscaling
+            cw, ch = self.preview_canvas.winfo_width(), self.preview_canvas.winfo_height()
+            if cw < 10: cw, ch = 800, 600 
+            pw, ph = rect.width, rect.height
+            zoom = min(cw/pw, ch/ph) * 0.95
+            zoom = round(min(max(zoom, self.PREVIEW_MIN_ZOOM), self.PREVIEW_MAX_ZOOM), 3)
+
+            # The stamp layer depends only on the stamp settings and the page size, so custom-item
+            # drags, selection changes and same-size page flips reuse the last raster.
+            # Building it reads the tab variables, so a changed stamp is drawn (ReportLab) here and rasterized by the worker.
+            stamp_key, stamp_img, stamp_pdf = None, None, None
+            tabs = (self.tab1, self.tab2, self.tab3)
+            # No position ticked on any enabled tab (or a later page with "first page only"): nothing to draw,
+            # so skip the key, ReportLab and the stamp raster
+            stamp_page = self.current_page_idx == 0 or not self.first_page_only_var.get()
+            if stamp_page and any(t.enabled.get() and any(v.get() for v in t.pos_vars.values()) for t in tabs):
+                state = self._stamp_state()
+                stamp_key = (pw, ph, zoom, state[0])
+                if self._stamp_cache is not None and self._stamp_cache[0] == stamp_key: stamp_img = self._stamp_cache[1]
+                else: stamp_pdf = self.get_watermark_bytes(pw, ph, state)
+
+            job = {"real_idx": real_page_idx, "page_no": self.current_page_idx, "cw": cw, "ch": ch, "zoom": zoom, "ph": ph,
+                   "stamp_key": stamp_key, "stamp_img": stamp_img, "stamp_pdf": stamp_pdf,
+                   # Copies: the worker records disp_w/disp_h on them while the user may be dragging the originals
+                   "items": [dict(item) for item in self.custom_overlays.get(real_page_idx, [])]}
+        except Exception as e:
+            print(f"Preview Error: {e}")
+            return
+
+        self._render_job = job
+        self._render_thread = threading.Thread(target=self._render_preview, args=(job, self._render_cancel), daemon=True)
+        self._render_thread.start()
+
+    def _render_preview(self, job, cancel):
+        # Worker thread: PyMuPDF raster + PIL compositing; no Tk calls until the result is posted back
+        with self._render_lock:
+            # A newer request queued behind this one makes it redundant
+            if cancel.is_set() or job is not self._render_job: return
+            try:
+                real_page_idx, zoom, ph = job["real_idx"], job["zoom"], job["ph"]
+
+                # Base PDF Render (using PyMuPDF, cached per page and zoom)
+                bg = self._get_base_image(real_page_idx, zoom)
+
+                # Standard Stamp Render (cached while the stamp settings are unchanged)
+                wm_img = job["stamp_img"]
+                if job["stamp_pdf"] is not None: wm_img = self._raster_stamp(job["stamp_pdf"], zoom, bg.size)
+                elif wm_img is not None and wm_img.size != bg.size: wm_img = wm_img.resize(bg.size, PREVIEW_RESAMPLE)
+                if wm_img is not None:
+                    # Base + stamp only change with the page, zoom or stamp settings, so item drags reuse the blend
+                    comp_key = (real_page_idx, zoom, job["stamp_key"])
+                    if self._composite_cache is not None and self._composite_cache[0] == comp_key:
+                        final = self._composite_cache[1]
+                    else:
+                        final = Image.alpha_composite(bg, wm_img)
+                        self._composite_cache = (comp_key, final)
+                else:
+                    final = bg # Not modified in place below, so the cached base stays clean
             
-            if real_page_idx in self.custom_overlays:
-                for item in self.custom_overlays[real_page_idx]:
-                    # Map PDF points -> Pixel Coordinates (Scale = 2)
-                    ix = item['x'] * 2
-                    iy = (page.rect.height - item['y']) * 2
+                # --- CUSTOM ITEMS LAYER (using PIL) ---
+                # Item geometry is defined for a 2x raster; k rescales it to the preview zoom
+                k = zoom / 2
+                # Pages without custom items show the (cached) base + stamp as is
+                overlay = Image.new("RGBA", final.size, (255,255,255,0)) if job["items"] else None
+                
+                for item in job["items"]:
+                    # Map PDF points -> Pixel Coordinates (Scale = zoom)
+                    ix = item['x'] * zoom
+                    iy = (ph - item['y']) * zoom
                     
                     if item['type'] == 'text':
                         try:
-                            f_size = int(item['size'] * 2) 
+                            f_size = max(1, int(item['size'] * zoom))
                             font_path = SYSTEM_FONT_MAP.get(item['font'], "arial.ttf")
                             if not os.path.exists(font_path): font = ImageFont.load_default()
                             else: font = ImageFont.truetype(font_path, f_size)
@@ -1209,7 +1382,7 @@ class PDFWatermarkApp:
                         t_h = bbox[3] - bbox[1]
                         
                         # Add a larger padding for safety (e.g. Italics)
-                        pad = 30
+                        pad = 30 * k
                         img_w = t_w + pad
                         img_h = t_h + pad
                         
@@ -1230,15 +1403,16 @@ class PDFWatermarkApp:
                             
                         # Paste (Center stays at ix, iy)
                         overlay.alpha_composite(txt_rot, dest=(int(ix - txt_rot.width/2), int(iy - txt_rot.height/2)))
-                        item['disp_w'] = txt_rot.width / 4; item['disp_h'] = txt_rot.height / 4
+                        # disp_w/disp_h stay in 2x-raster units / 4 (i.e. half-size in PDF points)
+                        item['disp_w'] = txt_rot.width / (4*k); item['disp_h'] = txt_rot.height / (4*k)
                         
                     elif item['type'] == 'arrow':
-                        l = item['len'] * 2
+                        l = item['len'] * zoom
                         
                         # Create arrow on explicit right-pointing shaft
                         # Shaft from Center-L/2 to Center+L/2
                         # Then we rotate the whole image
-                        arr_img = Image.new("RGBA", (int(l+100), int(l+100)), (0,0,0,0))
+                        arr_img = Image.new("RGBA", (int(l+100*k), int(l+100*k)), (0,0,0,0))
                         d = ImageDraw.Draw(arr_img)
                         cx, cy = arr_img.width/2, arr_img.height/2
                         
@@ -1252,71 +1426,90 @@ class PDFWatermarkApp:
                         end_x = cx + l/2
                         
                         # Shaft: stop at end_x - head_len
-                        head_len = 30 # Scaled
-                        d.line([(start_x, cy), (end_x - head_len + 5, cy)], fill=col, width=10)
+                        head_len = 30 * k # Scaled
+                        d.line([(start_x, cy), (end_x - head_len + 5*k, cy)], fill=col, width=max(1, int(10*k)))
                         
                         # Head (Triangle at Right End)
                         tip = (end_x, cy)
-                        top = (end_x - head_len, cy - 15)
-                        bot = (end_x - head_len, cy + 15)
+                        top = (end_x - head_len, cy - 15*k)
+                        bot = (end_x - head_len, cy + 15*k)
                         d.polygon([tip, top, bot], fill=col)
                         
                         # Rotate the entire arrow image
                         arr_rot = arr_img.rotate(item['angle'], resample=Image.BICUBIC)
                         overlay.alpha_composite(arr_rot, dest=(int(ix - arr_rot.width/2), int(iy - arr_rot.height/2)))
-                        item['disp_w'] = arr_rot.width/4; item['disp_h'] = arr_rot.height/4
+                        item['disp_w'] = arr_rot.width/(4*k); item['disp_h'] = arr_rot.height/(4*k)
 
                     elif item['type'] == 'img':
                         if os.path.exists(item['path']):
                             try:
                                 im_src = Image.open(item['path']).convert("RGBA")
-                                w_t = item['w'] * 2
+                                w_t = item['w'] * zoom
                                 asp = im_src.height / im_src.width
                                 h_t = w_t * asp
-                                im_res = im_src.resize((int(w_t), int(h_t)), Image.Resampling.LANCZOS)
+                                im_res = im_src.resize((max(1, int(w_t)), max(1, int(h_t))), PREVIEW_RESAMPLE)
                                 if item['opacity'] < 1.0:
                                     alpha = im_res.split()[3]
                                     alpha = alpha.point(lambda p: p * item['opacity'])
                                     im_res.putalpha(alpha)
                                 overlay.alpha_composite(im_res, dest=(int(ix-w_t/2), int(iy-h_t/2)))
-                                item['disp_w'] = w_t/4; item['disp_h'] = h_t/4
+                                item['disp_w'] = w_t/(4*k); item['disp_h'] = h_t/(4*k)
                             except: pass
 
-            final = Image.alpha_composite(final, overlay)
-            cw, ch = self.preview_canvas.winfo_width(), self.preview_canvas.winfo_height()
-            if cw < 10: cw, ch = 800, 600 
-            iw, ih = final.size
-            ratio = min(cw/iw, ch/ih)
-            self.current_preview_ratio = ratio 
-            
-            new_w, new_h = int(iw*ratio*0.95), int(ih*ratio*0.95)
-            final = final.resize((new_w, new_h), Image.Resampling.LANCZOS)
+                if overlay is not None: final = Image.alpha_composite(final, overlay)
+            except Exception as e:
+                print(f"Preview Error: {e}")
+                return
+
+        if cancel.is_set(): return
+        try: self.root.after(0, self._apply_preview, job, final, wm_img, cancel)
+        except RuntimeError: pass # Main loop already gone (window closing)
+
+    def _apply_preview(self, job, final, wm_img, cancel):
+        # Main thread: PhotoImage and canvas items must be created here
+        if cancel.is_set(): return # Rendered from a document that has since been replaced
+        if job["stamp_key"] is not None: self._stamp_cache = (job["stamp_key"], wm_img)
+        # Interaction code maps PDF -> screen as 2 * ratio (ratio was relative to the old 2x raster)
+        self.current_preview_ratio = job["zoom"] / 2
+        real_page_idx, ph = job["real_idx"], job["ph"]
+
+        # Already at display size, so no resample pass is needed
+        new_w, new_h = final.size
+        cx, cy = job["cw"]/2, job["ch"]/2
+        if self._preview_item is not None and self.tk_img and (self.tk_img.width(), self.tk_img.height()) == final.size:
+            # Same size as the last frame: refill the Tk photo and keep the canvas image, only the hit boxes are redrawn
+            self.tk_img.paste(final)
+            self.preview_canvas.coords(self._preview_item, cx, cy)
+            self.preview_canvas.delete("hitbox")
+        else:
+            self.preview_canvas.delete("all")
+            self.canvas_images = [] 
             self.tk_img = ImageTk.PhotoImage(final)
-            
-            cx, cy = cw/2, ch/2
-            self.preview_canvas.create_image(cx, cy, image=self.tk_img, anchor=tk.CENTER)
-            
-            img_x = cx - new_w/2; img_y = cy - new_h/2
-            if real_page_idx in self.custom_overlays:
-                for item in self.custom_overlays[real_page_idx]:
-                    sx = img_x + (item['x'] * 2 * ratio)
-                    sy = img_y + ((page.rect.height - item['y']) * 2 * ratio)
-                    dw = item.get('disp_w', 20) * ratio * 2
-                    dh = item.get('disp_h', 20) * ratio * 2
-                    self.preview_canvas.create_rectangle(sx-dw, sy-dh, sx+dw, sy+dh, fill="", outline="", tags=("item", item['uid']))
-                    if item['uid'] == self.selected_item_uid:
-                        self.preview_canvas.create_rectangle(sx-dw-5, sy-dh-5, sx+dw+5, sy+dh+5, outline="red", width=2, dash=(4,4))
-                        self.preview_canvas.create_rectangle(sx+dw, sy+dh, sx+dw+10, sy+dh+10, fill="red", tags=("resize_handle", item['uid']))
-
-            # Update Page Label
-            self.lbl_page.config(text=f"{self.current_page_idx + 1} / {len(self.page_mapping)}")
-
-        except Exception as e: print(f"Preview Error: {e}")
+            self._preview_item = self.preview_canvas.create_image(cx, cy, image=self.tk_img, anchor=tk.CENTER)
+        
+        ratio = self.current_preview_ratio
+        img_x = cx - new_w/2; img_y = cy - new_h/2
+        # Hit boxes follow the live items, sized from what the worker just drew
+        disp = {item['uid']: (item['disp_w'], item['disp_h']) for item in job["items"] if 'disp_w' in item}
+        if real_page_idx in self.custom_overlays:
+            for item in self.custom_overlays[real_page_idx]:
+                if item['uid'] in disp: item['disp_w'], item['disp_h'] = disp[item['uid']]
+                sx = img_x + (item['x'] * 2 * ratio)
+                sy = img_y + ((ph - item['y']) * 2 * ratio)
+                dw = item.get('disp_w', 20) * ratio * 2
+                dh = item.get('disp_h', 20) * ratio * 2
+                self.preview_canvas.create_rectangle(sx-dw, sy-dh, sx+dw, sy+dh, fill="", outline="", tags=("item", item['uid'], "hitbox"))
+                if item['uid'] == self.selected_item_uid:
+                    self.preview_canvas.create_rectangle(sx-dw-5, sy-dh-5, sx+dw+5, sy+dh+5, outline="red", width=2, dash=(4,4), tags=("hitbox",))
+                    self.preview_canvas.create_rectangle(sx+dw, sy+dh, sx+dw+10, sy+dh+10, fill="red", tags=("resize_handle", item['uid'], "hitbox"))
+
+        # Update Page Label
+        self.lbl_page.config(text=f"{job['page_no'] + 1} / {len(self.page_mapping)}")
 
     def save_settings(self):
-        data = { "t1": self.tab1.get_settings_dict(), "t2": self.tab2.get_settings_dict(), "t3": self.tab3.get_settings_dict(), "win": self.root.geometry(), "comp": self.compress_var.get() }
+        data = { "t1": self.tab1.get_settings_dict(), "t2": self.tab2.get_settings_dict(), "t3": self.tab3.get_settings_dict(), "win": self.root.geometry(), "comp": self.compress_var.get(), "first_only": self.first_page_only_var.get() }
         try:
-            with open("settings.json", "w") as f: json.dump(data, f, indent=4)
+            with open("settings.json", "w") as f: json.dump(data, f, separators=(",", ":"))
             print("[INFO] Settings Saved.")
         except: pass
 
@@ -1326,6 +1519,7 @@ class PDFWatermarkApp:
             with open("settings.json", "r") as f: d = json.load(f)
             self.root.geometry(d.get("win", "960x1152"))
             self.compress_var.set(d.get("comp", False))
+            self.first_page_only_var.set(d.get("first_only", False))
             self.tab1.load_settings_dict(d.get("t1"))
             self.tab2.load_settings_dict(d.get("t2"))
             self.tab3.load_settings_dict(d.get("t3"))
@@ -1333,10 +1527,11 @@ class PDFWatermarkApp:
         except: pass
 
     def reload_settings_action(self):
-        self.load_settings(); self.update_preview()
+        self.load_settings(); self._schedule_preview()
 
     def on_close(self):
         self.save_settings()
+        self._set_document(None) # Release the file handle (and wait for a running preview render)
         self.root.destroy()
 
     def generate_random_password(self):
@@ -1373,113 +1568,127 @@ class PDFWatermarkApp:
 
         is_overwrite = (os.path.abspath(out) == os.path.abspath(self.input_file))
         try:
-            if is_overwrite: self.doc_ref.close()
-
-            with open(self.input_file, "rb") as f: input_stream = io.BytesIO(f.read())
-            r = PdfReader(input_stream)
-            if r.is_encrypted and self.input_password: r.decrypt(self.input_password)
-                
-            w = PdfWriter()
-            
-            for real_idx in self.page_mapping:
-                if real_idx < len(r.pages):
-                    p = r.pages[real_idx]
-                    try: p.transfer_rotation_to_content()
-                    except: pass
-                    
-                    w_pt = float(p.mediabox.width)
-                    h_pt = float(p.mediabox.height)
-                    
-                    # 1. Standard Stamps
-                    pkt = self.get_combined_watermark(w_pt, h_pt)
-                    wm_reader = PdfReader(pkt)
-                    if len(wm_reader.pages) > 0: p.merge_page(wm_reader.pages[0])
-                    
-                    # 2. Custom Items (New Logic)
-                    if real_idx in self.custom_overlays:
-                        cust_pkt = io.BytesIO()
-                        c = canvas.Canvas(cust_pkt, pagesize=(w_pt, h_pt))
-                        
-                        for item in self.custom_overlays[real_idx]:
-                            c.saveState()
-                            c.translate(item['x'], item['y'])
-                            
-                            if item['type'] == 'text':
-                                c.rotate(item['angle'])
-                                c.setFillAlpha(item['opacity'])
-                                f_name = item.get('font', 'Helvetica')
-                                # Ensure font registered logic
-                                if f_name in REGISTERED_FONTS: c.setFont(f_name, item['size'])
-                                else: c.setFont("Helvetica", item['size'])
-                                
-                                c.setFillColor(HexColor(item['color']))
-                                offset_y = -(item['size'] * 0.35)
-                                c.drawCentredString(0, offset_y, item['content'])
-                                
-                            elif item['type'] == 'arrow':
-                                c.rotate(item['angle'])
-                                col_hex = COLOR_TO_HEX.get(item['color_name'], "#FF0000")
-                                c.setStrokeColor(HexColor(col_hex), alpha=item['opacity'])
-                                c.setLineWidth(5)
-                                # FIXED: Shaft stops at tip base
-                                L = item['len']
-                                head_len = 15 # PDF units
-                                c.line(-L/2, 0, L/2 - head_len + 2, 0)
-                                # Head
-                                c.setFillColor(HexColor(col_hex), alpha=item['opacity'])
-                                p_h = c.beginPath()
-                                p_h.moveTo(L/2, 0)
-                                p_h.lineTo(L/2 - head_len, 7)
-                                p_h.lineTo(L/2 - head_len, -7)
-                                p_h.close()
-                                c.drawPath(p_h, fill=1, stroke=0)
-                                
-                            elif item['type'] == 'img':
-                                if os.path.exists(item['path']):
-                                    try:
-                                        ir = ImageReader(item['path'])
-                                        iw, ih = ir.getSize()
-                                        asp = ih / iw
-                                        c.drawImage(ir, -item['w']/2, -item['w']*asp/2, item['w'], item['w']*asp, mask='auto')
-                                    except: pass
-                            
-                            c.restoreState()
-                        
-                        c.save()
-                        cust_pkt.seek(0)
-                        cust_reader = PdfReader(cust_pkt)
-                        if len(cust_reader.pages)>0: p.merge_page(cust_reader.pages[0])
-
-                    # 3. Tiled
-                    tiled_text = options["tiled_text"]
+            if is_overwrite: self._set_document(None)
+
+            # Stamp a private copy; doc_ref stays untouched for the preview. Pages are read from the file on demand
+            doc = fitz.open(self.input_file)
+            if doc.needs_pass and self.input_password: doc.authenticate(self.input_password)
+            mapping = [i for i in self.page_mapping if i < doc.page_count]
+            # An incremental update keeps the previous revision in the file, so it is only safe when every original page
+            # is kept in place (and stamped), the input is not encrypted (save-as drops that too) and no compression is asked for
+            can_append = (is_overwrite and self.page_mapping == list(range(doc.page_count))
+                          and not (doc.metadata or {}).get("encryption") and not self.compress_var.get())
+            doc.select(mapping)
+
+            tiled_text = options["tiled_text"]
+            first_only = self.first_page_only_var.get()
+            stamp_state = self._stamp_state()
+            # Stamp/tiled overlays depend only on page size: build each once and reuse it
+            # (show_pdf_page also shares one XObject per source doc instead of embedding a copy per page)
+            size_overlays = {}
+            for out_idx, (page, real_idx) in enumerate(zip(doc, mapping)):
+                # page.rect is the displayed (rotated) size, same as the preview draws on
+                w_pt, h_pt = page.rect.width, page.rect.height
+                wh = (round(w_pt, 2), round(h_pt, 2))
+                if wh not in size_overlays:
+                    wm_doc = fitz.open("pdf", self.get_watermark_bytes(w_pt, h_pt, stamp_state))
+                    tiled_doc = None
                     if tiled_text.strip():
-                        overlay_pkt = self.get_overlay_watermark(tiled_text, w_pt, h_pt)
-                        overlay_reader = PdfReader(overlay_pkt)
-                        if len(overlay_reader.pages) > 0: p.merge_page(overlay_reader.pages[0]) 
-
-                    w.add_page(p)
-            
+                        tiled_doc = fitz.open("pdf", self.get_overlay_watermark(tiled_text, w_pt, h_pt).getvalue())
+                    size_overlays[wh] = (wm_doc, tiled_doc)
+                wm_doc, tiled_doc = size_overlays[wh]
+
+                # 1. Standard Stamps (later pages are left as they are with "first page only")
+                if out_idx == 0 or not first_only: self._apply_overlay(page, wm_doc)
+
+                # 2. Custom Items (New Logic)
+                if real_idx in self.custom_overlays:
+                    cust_pkt = io.BytesIO()
+                    c = canvas.Canvas(cust_pkt, pagesize=(w_pt, h_pt))
+
+                    for item in self.custom_overlays[real_idx]:
+                        c.saveState()
+                        c.translate(item['x'], item['y'])
+
+                        if item['type'] == 'text':
+                            c.rotate(item['angle'])
+                            c.setFillAlpha(item['opacity'])
+                            f_name = item.get('font', 'Helvetica')
+                            # Ensure font registered logic
+                            if ensure_font(f_name): c.setFont(f_name, item['size'])
+                            else: c.setFont("Helvetica", item['size'])
+
+                            c.setFillColor(HexColor(item['color']))
+                            offset_y = -(item['size'] * 0.35)
+                            c.drawCentredString(0, offset_y, item['content'])
+
+                        elif item['type'] == 'arrow':
+                            c.rotate(item['angle'])
+                            col_hex = COLOR_TO_HEX.get(item['color_name'], "#FF0000")
+                            c.setStrokeColor(HexColor(col_hex), alpha=item['opacity'])
+                            c.setLineWidth(5)
+                            # FIXED: Shaft stops at tip base
+                            L = item['len']
+                            head_len = 15 # PDF units
+                            c.line(-L/2, 0, L/2 - head_len + 2, 0)
+                            # Head
+                            c.setFillColor(HexColor(col_hex), alpha=item['opacity'])
+                            p_h = c.beginPath()
+                            p_h.moveTo(L/2, 0)
+                            p_h.lineTo(L/2 - head_len, 7)
+                            p_h.lineTo(L/2 - head_len, -7)
+                            p_h.close()
+                            c.drawPath(p_h, fill=1, stroke=0)
+
+                        elif item['type'] == 'img':
+                            if os.path.exists(item['path']):
+                                try:
+                                    ir = ImageReader(item['path'])
+                                    iw, ih = ir.getSize()
+                                    asp = ih / iw
+                                    c.drawImage(ir, -item['w']/2, -item['w']*asp/2, item['w'], item['w']*asp, mask='auto')
+                                except: pass
+
+                        c.restoreState()
+
+                    c.save()
+                    cust_doc = fitz.open("pdf", cust_pkt.getvalue())
+                    self._apply_overlay(page, cust_doc)
+                    cust_doc.close()
+
+                # 3. Tiled
+                if tiled_doc: self._apply_overlay(page, tiled_doc)
+
+            save_kwargs = {}
+            # ReportLab already embeds TTF stamps as subsets, so subset_fonts() would only rework the source's fonts
+            if self.compress_var.get(): save_kwargs.update(garbage=4, deflate=True, deflate_images=True, deflate_fonts=True)
             if user_password:
-                perms = UserAccessPermissions(0) 
-                if options["allow_print"]: perms |= UserAccessPermissions.PRINT
-                if options["allow_copy"]: perms |= UserAccessPermissions.EXTRACT
-                w.encrypt(user_password=user_password, owner_password=owner_password, permissions_flag=perms, algorithm="AES-128")
-
-            with open(out, "wb") as f_out: w.write(f_out)
-            
-            if self.compress_var.get() and not user_password:
-                temp_compressed = out + ".tmp"
-                try:
-                    doc = fitz.open(out)
-                    doc.save(temp_compressed, garbage=4, deflate=True)
-                    doc.close()
-                    shutil.move(temp_compressed, out) 
-                except: 
-                    if os.path.exists(temp_compressed): os.remove(temp_compressed)
+                perms = 0
+                if options["allow_print"]: perms |= fitz.PDF_PERM_PRINT
+                if options["allow_copy"]: perms |= fitz.PDF_PERM_COPY
+                save_kwargs.update(encryption=fitz.PDF_ENCRYPT_AES_128, user_pw=user_password,
+                                   owner_pw=owner_password, permissions=perms)
+
+            if can_append and not user_password and doc.can_save_incrementally():
+                # Append only the changed objects instead of rewriting the whole PDF. The unstamped previous
+                # revision stays recoverable from the file, hence the conditions on can_append above
+                doc.save(out, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+                doc.close()
+            elif is_overwrite:
+                # MuPDF cannot do a full save over the file it is reading from: build it in memory, then write
+                data = doc.tobytes(**save_kwargs)
+                doc.close()
+                with open(out, "wb") as f: f.write(data)
+            else:
+                doc.save(out, **save_kwargs)
+                doc.close()
+            for wm_doc, tiled_doc in size_overlays.values():
+                wm_doc.close()
+                if tiled_doc: tiled_doc.close()
 
             if is_overwrite:
-                self.doc_ref = fitz.open(self.input_file)
-                self.update_preview()
+                self._set_document(fitz.open(self.input_file))
+                self._schedule_preview()
             
             msg = f"Saved: {out}"
             if user_password: msg += f"\nPasswords saved to {os.path.basename(out)}.pass"
@@ -1489,7 +1698,7 @@ class PDFWatermarkApp:
         except Exception as e: 
             messagebox.showerror("Error", str(e))
             if is_overwrite:
-                 try: self.doc_ref = fitz.open(self.input_file)
+                 try: self._set_document(fitz.open(self.input_file))
                  except: pass
 
 if __name__ == "__main__":
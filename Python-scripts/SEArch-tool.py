@@ -23,7 +23,11 @@ Generated on: 2025-09-26 15:52:21 +07
   source if their modification time is older than the specified threshold (Min: 30 days).
 - **Interval Constraints:** Minimum: 0.5 minutes (30 seconds), Default: 5 minutes, Maximum: 60 minutes.
 - **Log Header:** ['run date / time', 'source folder', 'source file name', 'target folder (archived file name)', 'status / error message']
-- **Recursive Processing:** Uses os.walk() to include files within subfolders.
+- **Archive Index:** Each .tar has a sidecar '<archive>.tar.idx' listing its members, so files already 
+  archived are skipped without re-reading the tar. A missing or stale index is rebuilt automatically.
+- **Idle Runs:** A source that matched no files is remembered (with its directory mtimes) in 
+  '.se-arch-state.json' in the log directory; the next run skips re-scanning it if nothing changed.
+- **Recursive Processing:** Uses os.scandir() to include files within subfolders.
 
 Usage:
   python interval_copy_util.py                                   (Runs the GUI using default se-arch.ini)
@@ -42,7 +46,7 @@ Options:
                    Overrides the action (copy or move) specified in the configuration file.
   --help, -h       Show this help message and exit.
   --hiden-import   This hint is for PyInstaller: additional modules to include 
-                   are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk', 'tarfile', 'fnmatch'.
+                   are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk', 'tarfile', 'fnmatch', 're', 'concurrent.futures', 'json', 'queue'.
 """
 
 import sys
@@ -52,10 +56,19 @@ import time
 import argparse
 import configparser
 import csv
+import io
 import tarfile 
+import stat
+import contextlib
+import functools
+import json
+import threading
+import queue
+import concurrent.futures
 from datetime import datetime, timedelta
 from collections import deque, defaultdict 
 import fnmatch 
+import re
 
 # Non-standard module needed:
 # If 'schedule' is missing, install it with: pip install schedule
@@ -69,6 +82,9 @@ except ImportError:
 # --- Configuration Constants ---
 TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 LOG_HISTORY_LIMIT = 100 
+GUI_EVENT_DRAIN_MS = 200   # How often the GUI applies log rows queued by the worker thread
+GUI_HIDDEN_POLL_MS = 5000 # check_schedule interval while the window is minimized
+GUI_EVENT_BATCH = 200      # Max rows applied per drain, so a burst cannot stall the event loop
 
 # --- UNIQUE CONFIG NAME ---
 CONFIG_FILE_NAME = 'se-arch.ini'
@@ -82,16 +98,34 @@ GLOBAL_LOG_DIR = None
 GLOBAL_CONFIG_FILE_PATH = None
 # Global variable to hold the log prefix, set after config is loaded
 GLOBAL_LOG_PREFIX = DEFAULT_LOG_PREFIX 
+# Global flag (config 'preserve_mode'): copy permission bits/flags with copystat instead of only restoring timestamps
+GLOBAL_PRESERVE_MODE = False
+# Parsed config file, reused until the file's mtime changes (see _read_config)
+_CONFIG_CACHE = {'path': None, 'mtime': None, 'parser': None}
 
 # --- INTERVAL CONSTANTS ---
 MIN_INTERVAL_MINUTES = 0.5  # 30 seconds
 DEFAULT_INTERVAL_MINUTES = 5 
 MAX_INTERVAL_MINUTES = 60 
+CLI_MAX_IDLE_SLEEP_SECONDS = 30  # Upper bound for one CLI idle sleep when no countdown is shown
 
 # --- DELETION CONSTANTS (for 'move' action) ---
 MIN_DELETE_AGE_DAYS = 30
 DEFAULT_DELETE_AGE_DAYS = 30
 
+# --- DEFAULT SETTINGS (log_dir is added per config file location in load_config) ---
+DEFAULT_SETTINGS = {
+    'source_dirs': '', 
+    'target_dir': '',
+    'interval_minutes': str(DEFAULT_INTERVAL_MINUTES),
+    'file_patterns': '*.*', 
+    'mode': 'copy',
+    'action': 'copy', 
+    'delete_files_older_than_days': str(DEFAULT_DELETE_AGE_DAYS),
+    'log_prefix': DEFAULT_LOG_PREFIX,
+    'preserve_mode': 'false'
+}
+
 # --- LOG HEADERS ---
 LOG_HEADER = ['run date / time', 'source folder', 'source file name', 'target folder (archived file name)', 'status / error message']
 TREE_COLUMNS = ['Time', 'Source File Name', 'Source Path', 'Target Path/Archive', 'Status'] 
@@ -102,12 +136,57 @@ PATH_SEP_HINT = os.sep
 # Time structure formats
 COPY_TIME_SUBDIR_FORMAT = f'%Y{os.sep}%m{os.sep}%d{os.sep}%H'
 ARCHIVE_TIME_SUBDIR_FORMAT = f'%Y{os.sep}%m'
-
-# Global Deque for log history
+# Cache bucket for formatted time segments. 15 minutes divides every real UTC offset and DST
+# shift, so a bucket never straddles a local hour/day boundary (plain ts // 3600 would for +05:30).
+TIME_BUCKET_SECONDS = 900
+# Line breaks in the GUI source box are treated like ';' separators
+_NL_TO_SEMI = str.maketrans('\n\r', ';;')
+# Control characters collapsed to a space so an error message stays on one CSV/Treeview line
+_ERR_SANITIZE = re.compile(r'[\r\n\t]+')
+
+# Global Deque for log history (newest first via appendleft; maxlen evicts the oldest in O(1),
+# which update_log_display relies on to delete only the evicted rows)
 LOG_HISTORY = deque(maxlen=LOG_HISTORY_LIMIT)
 
+# Pending CSV log rows (flushed every LOG_FLUSH_THRESHOLD rows and at the end of each run)
+_LOG_BUFFER = []
+_LOG_LOCK = threading.RLock()
+LOG_FLUSH_THRESHOLD = 128
+
+# Per-process caches so the log path is not re-statted for every flush
+_LOG_DIR_ENSURED = set()
+_LOG_FILE_HEADER_WRITTEN = set()
+
+# --- COPY CONSTANTS ---
+COPY_BUFFER_SIZE = 1 << 20      # 1 MB user-space fallback buffer
+KERNEL_COPY_CHUNK = 1 << 30     # Max bytes per copy_file_range/sendfile call
+
+# --- ARCHIVE CONSTANTS ---
+ARCHIVE_INDEX_SUFFIX = '.idx'   # Sidecar file listing archived member names (one per line)
+HAS_FADVISE = hasattr(os, 'posix_fadvise') # Page-cache hints for archive source reads
+try:
+    import pwd, grp # Owner names for tar headers (POSIX only)
+except ImportError:
+    pwd = grp = None
+TAR_COPY_BUFFER_SIZE = 1 << 20  # Read/copy chunk used when streaming files into a tar
+
+# Worker threads used for copy mode (copying is I/O-bound and releases the GIL)
+COPY_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# --- SCAN STATE (idle-run short-circuit) ---
+SCAN_STATE_FILE_NAME = '.se-arch-state.json'
+SCAN_STATE_MTIME_SLACK_SECONDS = 2  # FAT/SMB mtimes can be as coarse as 2 seconds
+
+# Target directories already created during the current run (reset by process_files)
+_DIRS_CREATED = set()
+
 # --- Core Logic ---
 
+@functools.lru_cache(maxsize=128)
+def _norm_abs(path):
+    """Memoized os.path.normpath(os.path.abspath(path)); the working directory never changes at runtime."""
+    return os.path.normpath(os.path.abspath(path))
+
 def configure_paths(alt_config_path=None, log_dir_override=None):
     """
     Determines the path of the config file and the log directory (GLOBAL_LOG_DIR).
@@ -120,25 +199,24 @@ def configure_paths(alt_config_path=None, log_dir_override=None):
     # 1. Determine the path to the configuration file (se-arch.ini or alternate)
     if alt_config_path:
         # Use the explicit alternate path
-        config_file_path = os.path.normpath(os.path.abspath(alt_config_path))
+        config_file_path = _norm_abs(alt_config_path)
     else:
         # Use the default path: ./config/se-arch.ini
-        config_file_path = os.path.join(DEFAULT_CONFIG_PATH, CONFIG_FILE_NAME)
-        config_file_path = os.path.normpath(os.path.abspath(config_file_path))
+        config_file_path = _norm_abs(os.path.join(DEFAULT_CONFIG_PATH, CONFIG_FILE_NAME))
         
     GLOBAL_CONFIG_FILE_PATH = config_file_path
+    previous_log_dir = GLOBAL_LOG_DIR
     
     # 2. Determine the path for the log directory (where config is stored/read from)
     if log_dir_override:
         # Override takes precedence
-        GLOBAL_LOG_DIR = os.path.normpath(os.path.abspath(log_dir_override))
+        GLOBAL_LOG_DIR = _norm_abs(log_dir_override)
     elif GLOBAL_LOG_DIR is None:
         # First time call: Try to read log_dir from the config file itself
-        temp_config = configparser.ConfigParser()
+        temp_config = _read_config(config_file_path)
         
-        if os.path.exists(config_file_path):
+        if temp_config is not None:
             try:
-                temp_config.read(config_file_path)
                 custom_log_dir = temp_config['Settings'].get('log_dir')
                 
                 if custom_log_dir and os.path.isabs(custom_log_dir):
@@ -153,44 +231,47 @@ def configure_paths(alt_config_path=None, log_dir_override=None):
             # If config file doesn't exist, use its intended directory as the log_dir
             GLOBAL_LOG_DIR = os.path.dirname(config_file_path)
 
-    # 3. Ensure the determined log directory exists
-    os.makedirs(GLOBAL_LOG_DIR, exist_ok=True)
+    # 3. Ensure the determined log directory exists (already done if it did not change)
+    if GLOBAL_LOG_DIR != previous_log_dir:
+        os.makedirs(GLOBAL_LOG_DIR, exist_ok=True)
     
     return GLOBAL_CONFIG_FILE_PATH
 
+def _read_config(config_file_path):
+    """
+    Returns the parsed config file, re-parsing only when its path or mtime changed.
+    Returns None if the file does not exist.
+    """
+    try:
+        mtime = os.stat(config_file_path).st_mtime_ns
+    except OSError:
+        return None
+    
+    if _CONFIG_CACHE['path'] == config_file_path and _CONFIG_CACHE['mtime'] == mtime:
+        return _CONFIG_CACHE['parser']
+    
+    parser = configparser.ConfigParser()
+    parser.read(config_file_path)
+    _CONFIG_CACHE.update(path=config_file_path, mtime=mtime, parser=parser)
+    return parser
+
 def load_config(alt_config_path=None):
     """Loads configuration from the determined config file path and sets GLOBAL_LOG_PREFIX."""
-    global GLOBAL_LOG_PREFIX
+    global GLOBAL_LOG_PREFIX, GLOBAL_PRESERVE_MODE
     
     # Determine the configuration file path (and the GLOBAL_LOG_DIR)
     config_file_path = configure_paths(alt_config_path)
     
-    config = configparser.ConfigParser()
-    default_interval_str = str(DEFAULT_INTERVAL_MINUTES)
-    default_delete_age_str = str(DEFAULT_DELETE_AGE_DAYS)
-    
     # The default log_dir is the path determined by configure_paths based on the config location
-    default_log_dir = os.path.dirname(config_file_path)
-    
-    default_settings = {
-        'source_dirs': '', 
-        'target_dir': '',
-        'interval_minutes': default_interval_str,
-        'file_patterns': '*.*', 
-        'mode': 'copy',
-        'action': 'copy', 
-        'delete_files_older_than_days': default_delete_age_str,
-        'log_dir': default_log_dir,
-        'log_prefix': DEFAULT_LOG_PREFIX
-    }
+    default_settings = dict(DEFAULT_SETTINGS, log_dir=os.path.dirname(config_file_path))
 
-    # Load from file or initialize with defaults
-    if not os.path.exists(config_file_path):
+    # Load from file (cached while unchanged) or initialize with defaults
+    config = _read_config(config_file_path)
+    if config is None:
+        config = configparser.ConfigParser()
         config['Settings'] = default_settings
         # If config file doesn't exist, we need to save the path that should be used for the first run
     else:
-        config.read(config_file_path)
-        
         if 'Settings' not in config:
              config['Settings'] = {}
 
@@ -204,6 +285,10 @@ def load_config(alt_config_path=None):
     
     # Update GLOBAL_LOG_PREFIX from the loaded or default config
     GLOBAL_LOG_PREFIX = config['Settings'].get('log_prefix', DEFAULT_LOG_PREFIX)
+    try:
+        GLOBAL_PRESERVE_MODE = config['Settings'].getboolean('preserve_mode', fallback=False)
+    except ValueError:
+        GLOBAL_PRESERVE_MODE = False
     
     # If the log_dir in the file is different from what was globally set by the file's location,
     # we need to reconfigure the paths (only updating GLOBAL_LOG_DIR).
@@ -237,41 +322,75 @@ def save_config(source_dirs, target_dir, interval_minutes, file_patterns, mode,
         'delete_files_older_than_days': str(delete_age_days), 
         'log_dir': log_dir, 
         'log_prefix': log_prefix, 
+        'preserve_mode': 'true' if GLOBAL_PRESERVE_MODE else 'false',
     }
     
     try:
         with open(GLOBAL_CONFIG_FILE_PATH, 'w') as configfile:
             config.write(configfile)
+        # The parser just written is what the next load_config would read back
+        _CONFIG_CACHE.update(path=GLOBAL_CONFIG_FILE_PATH, mtime=os.stat(GLOBAL_CONFIG_FILE_PATH).st_mtime_ns, parser=config)
         
         print(f"Configuration saved to {GLOBAL_CONFIG_FILE_PATH}")
     except Exception as e:
         print(f"CRITICAL ERROR: Could not save configuration to {GLOBAL_CONFIG_FILE_PATH}: {e}")
 
-def write_log_entry(data_row, log_history_deque=None, app_instance=None):
-    """Writes a single row to the CSV log file and updates the in-memory history."""
+def flush_log_buffer():
+    """Writes all buffered log rows to the daily CSV log file with a single open/write/close."""
+    with _LOG_LOCK: # Worker threads may log (and trigger a flush) concurrently
+        if not _LOG_BUFFER:
+            return
     
-    # Use the global log directory and prefix for the daily log file
-    LOG_DIR = GLOBAL_LOG_DIR if GLOBAL_LOG_DIR else DEFAULT_CONFIG_PATH
-    LOG_PREFIX = GLOBAL_LOG_PREFIX if GLOBAL_LOG_PREFIX else DEFAULT_LOG_PREFIX
+        # Use the global log directory and prefix for the daily log file
+        LOG_DIR = GLOBAL_LOG_DIR if GLOBAL_LOG_DIR else DEFAULT_CONFIG_PATH
+        LOG_PREFIX = GLOBAL_LOG_PREFIX if GLOBAL_LOG_PREFIX else DEFAULT_LOG_PREFIX
         
-    # LOG_FILE_DAILY now uses the GLOBAL_LOG_PREFIX
-    LOG_FILE_DAILY = os.path.join(LOG_DIR, f'{LOG_PREFIX}{datetime.now().strftime("%y%m%d")}.csv')
-    file_exists = os.path.exists(LOG_FILE_DAILY)
+        # LOG_FILE_DAILY now uses the GLOBAL_LOG_PREFIX
+        flush_time = datetime.now()
+        LOG_FILE_DAILY = os.path.join(LOG_DIR, f'{LOG_PREFIX}{flush_time.strftime("%y%m%d")}.csv')
     
-    try:
-        # Ensure log directory exists before writing
-        os.makedirs(LOG_DIR, exist_ok=True)
+        try:
+            # Ensure log directory exists before writing (once per directory)
+            if LOG_DIR not in _LOG_DIR_ENSURED:
+                os.makedirs(LOG_DIR, exist_ok=True)
+                _LOG_DIR_ENSURED.add(LOG_DIR)
         
-        with open(LOG_FILE_DAILY, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            # A new day (or prefix/dir) gives a new file name, so the header check re-runs on rollover
+            need_header = LOG_FILE_DAILY not in _LOG_FILE_HEADER_WRITTEN and not os.path.exists(LOG_FILE_DAILY)
+        
+            # Serialize the whole batch in memory, then append it with a single os.write()
+            sio = io.StringIO()
+            writer = csv.writer(sio, quoting=csv.QUOTE_ALL)
             
-            if not file_exists:
+            if need_header:
                 writer.writerow(LOG_HEADER)
             
-            writer.writerow(data_row)
+            writer.writerows(_LOG_BUFFER)
+            data = sio.getvalue().encode('utf-8')
             
-    except Exception as e:
-        print(f"[{datetime.now().strftime(TIME_FORMAT)}] CRITICAL ERROR writing to log: {e}")
+            fd = os.open(LOG_FILE_DAILY, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        
+            _LOG_FILE_HEADER_WRITTEN.add(LOG_FILE_DAILY)
+            
+        except Exception as e:
+            print(f"[{flush_time.strftime(TIME_FORMAT)}] CRITICAL ERROR writing to log: {e}")
+        finally:
+            _LOG_BUFFER.clear()
+
+def write_log_entry(data_row, log_history_deque=None, app_instance=None):
+    """Queues a single row for the CSV log file and updates the in-memory history."""
+    
+    # Disk I/O is batched; rows are written by flush_log_buffer()
+    with _LOG_LOCK:
+        _LOG_BUFFER.append(data_row)
+        if len(_LOG_BUFFER) >= LOG_FLUSH_THRESHOLD:
+            flush_log_buffer()
 
     if log_history_deque is not None:
         # Prepare GUI row based on the new log structure: 
@@ -280,12 +399,214 @@ def write_log_entry(data_row, log_history_deque=None, app_instance=None):
             data_row[2] if data_row[2] else os.path.basename(data_row[3]), # Source File Name or Archive Name
             data_row[1],             # Source Path (folder/dir)
             data_row[3],             # Target Path (file/archive path)
-            data_row[4]              # Status / Error Message
+            data_row[4],             # Status / Error Message
+            # Error flag, classified once here instead of on every redraw (not a display column)
+            data_row[4].startswith(("ERROR", "CRITICAL")) or "(ERROR DELETING SOURCE:" in data_row[4]
         ]
-        log_history_deque.appendleft(gui_row) 
-        
         if app_instance is not None:
-            app_instance.update_log_display()
+            # Called from the GUI worker thread: the Tk thread applies the row (see App._drain_events)
+            app_instance.post_log_row(gui_row)
+        else:
+            log_history_deque.appendleft(gui_row) 
+
+def _sanitize(e):
+    """Returns str(e) on one line; the regex only runs when a control character is present."""
+    s = str(e)
+    return _ERR_SANITIZE.sub(' ', s) if '\n' in s or '\r' in s or '\t' in s else s
+
+def _ensure_dir(path):
+    """Creates a target directory once per run; repeat calls for the same path skip the syscalls."""
+    if path not in _DIRS_CREATED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_CREATED.add(path)
+
+def _fast_copy(src, dst, src_stat=None):
+    """
+    Copies file content via the fastest available path: os.copy_file_range (Linux, allows
+    reflinks), then os.sendfile, then a 1 MB read/write loop. Timestamps are restored from
+    src_stat (captured during the scan) with a single os.utime; shutil.copystat (same result
+    as shutil.copy2) is only used when preserve_mode is enabled or no stat is available.
+    """
+    binary_flag = getattr(os, 'O_BINARY', 0) # Required on Windows to avoid newline translation
+    in_fd = os.open(src, os.O_RDONLY | binary_flag)
+    try:
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary_flag, 0o644)
+        try:
+            # Kernel copies advance both file offsets, so each fallback resumes where the last stopped
+            done = False
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while os.copy_file_range(in_fd, out_fd, KERNEL_COPY_CHUNK) > 0:
+                        pass
+                    done = True
+                except OSError:
+                    pass
+            
+            if not done and hasattr(os, 'sendfile'):
+                try:
+                    while os.sendfile(out_fd, in_fd, None, KERNEL_COPY_CHUNK) > 0:
+                        pass
+                    done = True
+                except OSError:
+                    pass
+            
+            if not done:
+                while buf := os.read(in_fd, COPY_BUFFER_SIZE):
+                    view = memoryview(buf)
+                    while view:
+                        view = view[os.write(out_fd, view):]
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    
+    if GLOBAL_PRESERVE_MODE or src_stat is None:
+        shutil.copystat(src, dst)
+    else:
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+def _copy_file_task(source_path, filename, target_path, final_target_dir, action, current_runtime_str, file_stat=None):
+    """
+    Copies (and for 'move', deletes) a single file on a copy worker thread.
+    Returns (log_entry, error_msg); error_msg is None on success.
+    """
+    log_entry = [current_runtime_str, source_path, filename, target_path, ""]
+    try:
+        # Only the first file of the group actually hits the filesystem
+        _ensure_dir(final_target_dir)
+        _fast_copy(source_path, target_path, file_stat) 
+        
+        log_entry[4] = "SUCCESS (Copied)"
+        
+        if action == 'move':
+            # In copy mode + move, we delete regardless of age (GUI history is updated by the caller)
+            remove_source_file(source_path, log_entry)
+        
+        return log_entry, None
+    
+    except Exception as e:
+        error_msg = _sanitize(e)
+        log_entry[4] = f"ERROR ({action.title()} failed): {error_msg}"
+        return log_entry, error_msg
+
+def _load_archive_index(archive_path):
+    """
+    Returns the set of member names recorded in the archive's sidecar index, or None
+    if the index is missing or older than the archive (i.e. it must be rebuilt).
+    """
+    index_path = archive_path + ARCHIVE_INDEX_SUFFIX
+    try:
+        if os.path.getmtime(index_path) < os.path.getmtime(archive_path):
+            return None
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return set(f.read().splitlines())
+    except OSError:
+        return None
+
+def _update_archive_index(archive_path, arcnames, rewrite=False):
+    """Appends (or with rewrite=True, replaces) member names in the archive's sidecar index."""
+    index_path = archive_path + ARCHIVE_INDEX_SUFFIX
+    try:
+        with open(index_path, 'w' if rewrite else 'a', encoding='utf-8') as f:
+            f.writelines(f"{name}\n" for name in arcnames)
+    except OSError as e:
+        print(f"  - WARNING: Could not update archive index {index_path}: {e}")
+
+def _sources_overlap(source_dirs):
+    """True if any two configured source directories are the same or nested in one another."""
+    norm_dirs = [os.path.normcase(os.path.normpath(os.path.abspath(d))) for d in source_dirs]
+    for i, first in enumerate(norm_dirs):
+        for second in norm_dirs[i + 1:]:
+            try:
+                if os.path.commonpath([first, second]) in (first, second):
+                    return True
+            except ValueError:
+                pass # Different drives (Windows) cannot overlap
+    return False
+
+@functools.lru_cache(maxsize=64)
+def _owner_names(uid, gid):
+    """Returns (uname, gname) for a tar header, as tarfile's gettarinfo() records them; a run sees few owners."""
+    uname = gname = ""
+    if pwd is not None:
+        with contextlib.suppress(KeyError):
+            uname = pwd.getpwuid(uid)[0]
+        with contextlib.suppress(KeyError):
+            gname = grp.getgrgid(gid)[0]
+    return uname, gname
+
+@functools.lru_cache(maxsize=16)
+def _compile_patterns(patterns):
+    """
+    Combines fnmatch-style patterns (a tuple) into a single compiled regex (one .match() per file).
+    Patterns are normalized with os.path.normcase, matching fnmatch.fnmatch() semantics.
+    Cached, so scheduled runs with unchanged patterns reuse the compiled regex.
+    """
+    if not patterns:
+        return re.compile(r'(?!)') # Nothing matches, same as any() over no patterns
+    return re.compile('|'.join(f'(?:{fnmatch.translate(os.path.normcase(p))})' for p in patterns))
+
+def _scan_tree(root_dir, dir_mtimes=None):
+    """
+    Recursively yields (DirEntry, relative_sub_path) for every file below root_dir.
+    Mirrors os.walk() (no descent into symlinked dirs, unreadable dirs skipped) but keeps
+    each DirEntry so its cached stat data can be reused by the caller.
+    If dir_mtimes is a dict, it is filled with {dir_path: mtime} (None for unreadable dirs).
+    """
+    stack = [(root_dir, '.')]
+    while stack:
+        current_dir, rel_sub_path = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[current_dir] = None
+                dir_mtimes[current_dir] = os.stat(current_dir).st_mtime
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if not is_dir:
+                        yield entry, rel_sub_path
+                    elif not entry.is_symlink():
+                        child_rel = entry.name if rel_sub_path == '.' else os.path.join(rel_sub_path, entry.name)
+                        stack.append((entry.path, child_rel))
+        except OSError:
+            continue
+
+def _load_scan_state():
+    """Loads the per-source scan state saved by the previous run (empty dict if missing/corrupt)."""
+    state_path = os.path.join(GLOBAL_LOG_DIR or DEFAULT_CONFIG_PATH, SCAN_STATE_FILE_NAME)
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_scan_state(state):
+    """Atomically persists the per-source scan state (write to temp file, then os.replace)."""
+    state_path = os.path.join(GLOBAL_LOG_DIR or DEFAULT_CONFIG_PATH, SCAN_STATE_FILE_NAME)
+    temp_path = state_path + '.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, state_path)
+    except OSError as e:
+        print(f"  - WARNING: Could not save scan state {state_path}: {e}")
+
+def _source_unchanged(source_state, file_patterns):
+    """
+    True if the previous scan of this source matched no files (with the same patterns) and no
+    directory in the tree has changed since. Creating, deleting or renaming a file updates its
+    parent directory's mtime, so an unchanged tree cannot contain a new matching file.
+    """
+    if not source_state or source_state.get('patterns') != file_patterns:
+        return False
+    try:
+        return all(os.stat(d).st_mtime == m for d, m in source_state['dirs'].items())
+    except (OSError, KeyError, AttributeError):
+        return False
 
 def remove_source_file(source_path, log_entry, log_history_deque=None, app_instance=None):
     """Safely attempts to remove the source file and updates the log."""
@@ -295,7 +616,7 @@ def remove_source_file(source_path, log_entry, log_history_deque=None, app_insta
         print(f"  - Deleted source file: {source_path}")
         return True
     except Exception as delete_e:
-        log_entry[4] += f" (ERROR DELETING SOURCE: {str(delete_e).replace('\n', ' ')})"
+        log_entry[4] += f" (ERROR DELETING SOURCE: {_sanitize(delete_e)})"
         write_log_entry(log_entry, log_history_deque, app_instance)
         print(f"  - ERROR deleting source {source_path}: {delete_e}")
         return False
@@ -308,12 +629,14 @@ def process_files(source_dirs_str, target_dir, file_patterns, mode, action, dele
     source_dirs = [d.strip() for d in source_dirs_str.split(';') if d.strip()]
     patterns = [p.strip() for p in file_patterns.split(';') if p.strip()] 
     target_dir = os.path.normpath(os.path.abspath(target_dir))
-    current_runtime_str = datetime.now().strftime(TIME_FORMAT)
+    run_start = datetime.now()
+    current_runtime_str = run_start.strftime(TIME_FORMAT)
     total_processed_count = 0
 
     # Determine deletion threshold for archive/move mode
     delete_age_days_int = int(delete_age_days)
-    delete_age_threshold = datetime.now() - timedelta(days=delete_age_days_int)
+    delete_age_threshold = run_start - timedelta(days=delete_age_days_int)
+    delete_age_threshold_ts = delete_age_threshold.timestamp()
     
     if not source_dirs:
         print(f"[{current_runtime_str}] WARNING: No source directories configured. Skipping operation.")
@@ -324,8 +647,23 @@ def process_files(source_dirs_str, target_dir, file_patterns, mode, action, dele
     # ----------------------------------------------------
     # --- Collect and Group Files ---
     # ----------------------------------------------------
-    file_groups = defaultdict(list)
+    # Column-oriented groups (one list per field) avoid a per-file tuple object
+    file_groups = defaultdict(lambda: {'path': [], 'name': [], 'rel': [], 'mtime_ts': [], 'stat': [], 'link': []})
+    
+    # Paths from a single tree never repeat, so the per-file duplicate check is only needed
+    # when configured sources overlap (same dir listed twice, or one nested inside another)
+    track_duplicates = _sources_overlap(source_dirs)
     files_to_process = set() 
+    if track_duplicates:
+        print(f"[{current_runtime_str}] WARNING: Source directories overlap; files found under more than one source are processed once.")
+    _DIRS_CREATED.clear() # Target dirs may have been removed between scheduled runs
+    pattern_re = _compile_patterns(tuple(patterns))
+    time_segment_cache = {} # bucket_id -> (time_segment, archive_base_name)
+    is_copy_mode = mode == 'copy' # Hoisted out of the per-file loop
+    
+    # Idle-tick short-circuit: sources that matched nothing last run and have not changed are not re-scanned
+    previous_scan_state = _load_scan_state()
+    scan_state = {}
     
     for source_dir in source_dirs:
         source_dir_norm = os.path.normpath(os.path.abspath(source_dir))
@@ -337,140 +675,236 @@ def process_files(source_dirs_str, target_dir, file_patterns, mode, action, dele
 
         source_base_prefix = source_dir_norm.rstrip(os.sep) + os.sep
         
-        for root, _, files in os.walk(source_dir_norm):
-            rel_sub_path = os.path.relpath(root, source_dir_norm)
+        if _source_unchanged(previous_scan_state.get(source_dir_norm), file_patterns):
+            scan_state[source_dir_norm] = previous_scan_state[source_dir_norm]
+            print(f"[{current_runtime_str}] No changes since last run, skipping scan: {source_dir_norm}")
+            continue
+        
+        dir_mtimes = {}
+        source_match_count = 0
+        
+        for entry, rel_sub_path in _scan_tree(source_dir_norm, dir_mtimes):
+            filename = entry.name
+            source_path = entry.path
             
-            for filename in files:
-                source_path = os.path.join(root, filename)
+            if track_duplicates and source_path in files_to_process:
+                continue 
                 
-                if source_path in files_to_process:
-                    continue 
-                    
-                if not any(fnmatch.fnmatch(filename, p) for p in patterns):
-                    continue
+            name_for_match = os.path.normcase(filename) if IS_WINDOWS else filename
+            if not pattern_re.match(name_for_match):
+                continue
 
-                try:
-                    mod_timestamp = os.path.getmtime(source_path)
+            try:
+                # DirEntry caches its stat result, so no extra getmtime() syscall is needed
+                file_stat = entry.stat()
+                mod_timestamp = file_stat.st_mtime
+                
+                # Format the time segment once per bucket instead of fromtimestamp/strftime per file
+                bucket_id = int(mod_timestamp // TIME_BUCKET_SECONDS)
+                segments = time_segment_cache.get(bucket_id)
+                if segments is None:
                     mod_dt = datetime.fromtimestamp(mod_timestamp)
-                    
-                    if mode == 'copy':
-                        time_segment = mod_dt.strftime(COPY_TIME_SUBDIR_FORMAT)
-                        key = (source_dir_norm, time_segment, rel_sub_path)
+                    if is_copy_mode:
+                        segments = (mod_dt.strftime(COPY_TIME_SUBDIR_FORMAT), None)
                     else: # archive mode
-                        time_segment = mod_dt.strftime(ARCHIVE_TIME_SUBDIR_FORMAT) 
-                        archive_base_name = mod_dt.strftime('%Y%m%d') 
-                        key = (source_dir_norm, time_segment, archive_base_name)
-                    
-                    # Store file data: (source_path, filename, modification_dt, relative_sub_path, mod_timestamp)
-                    file_groups[key].append((source_path, filename, mod_dt, rel_sub_path, mod_timestamp))
+                        segments = (mod_dt.strftime(ARCHIVE_TIME_SUBDIR_FORMAT), mod_dt.strftime('%Y%m%d'))
+                    time_segment_cache[bucket_id] = segments
+                time_segment, archive_base_name = segments
+                
+                if is_copy_mode:
+                    key = (source_dir_norm, time_segment, rel_sub_path)
+                else: # archive mode
+                    key = (source_dir_norm, time_segment, archive_base_name)
+                
+                # Store file data column-wise: path, filename, relative_sub_path, mod_timestamp, stat_result
+                group = file_groups[key]
+                group['path'].append(source_path)
+                group['name'].append(filename)
+                group['rel'].append(rel_sub_path)
+                group['mtime_ts'].append(mod_timestamp)
+                group['stat'].append(file_stat)
+                group['link'].append(entry.is_symlink()) # Cached by DirEntry; file_stat describes the link target
+                if track_duplicates:
                     files_to_process.add(source_path)
+                source_match_count += 1
 
-                except Exception as e:
-                    print(f"  - WARNING: Could not get modification time or process {source_path}: {e}")
+            except Exception as e:
+                print(f"  - WARNING: Could not get modification time or process {source_path}: {e}")
+                source_match_count += 1 # Retry next run rather than caching an incomplete scan
+
+        # Remember empty scans only; skip caching if any dir was unreadable or changed within the
+        # mtime granularity window (a file created in the same tick would otherwise be missed)
+        recent_limit = time.time() - SCAN_STATE_MTIME_SLACK_SECONDS
+        if source_match_count == 0 and all(m is not None and m < recent_limit for m in dir_mtimes.values()):
+            scan_state[source_dir_norm] = {'patterns': file_patterns, 'dirs': dir_mtimes}
+
+    _save_scan_state(scan_state)
 
     # ----------------------------------------------------
     # --- Process Files by Group ---
     # ----------------------------------------------------
-    for key, files_to_handle in file_groups.items():
-        source_dir_norm = key[0]
-        time_segment = key[1]
+    # Copy mode fans files out to one shared thread pool; archive mode stays serial (one tar handle)
+    copy_executor = concurrent.futures.ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) if mode == 'copy' else None
+    copy_futures = {}
+    
+    try:
+        for key, group in file_groups.items():
+            source_dir_norm = key[0]
+            time_segment = key[1]
         
-        # --- Copy Mode Execution (Copy/Move) ---
-        if mode == 'copy':
-            rel_sub_path = key[2]
-            source_name = os.path.basename(source_dir_norm)
-            final_target_dir = os.path.join(target_dir, source_name, time_segment, rel_sub_path)
+            # --- Copy Mode Execution (Copy/Move) ---
+            if mode == 'copy':
+                rel_sub_path = key[2]
+                source_name = os.path.basename(source_dir_norm)
+                final_target_dir = os.path.join(target_dir, source_name, time_segment, rel_sub_path)
             
-            for source_path, filename, _, rel_sub_path, _ in files_to_handle:
-                target_path = os.path.join(final_target_dir, filename)
-                log_entry = [current_runtime_str, source_path, filename, target_path, ""]
-
-                try:
-                    os.makedirs(final_target_dir, exist_ok=True)
-                    shutil.copy2(source_path, target_path) 
-                    
-                    log_entry[4] = "SUCCESS (Copied)"
-                    
-                    if action == 'move':
-                        # In copy mode + move, we delete regardless of age
-                        remove_source_file(source_path, log_entry, log_history_deque, app_instance)
-                        
-                    write_log_entry(log_entry, log_history_deque, app_instance)
-                    
+                for source_path, filename, rel_sub_path, file_stat in zip(group['path'], group['name'], group['rel'], group['stat']):
+                    target_path = os.path.join(final_target_dir, filename)
                     print_source = os.path.join(rel_sub_path, filename) if rel_sub_path != '.' else filename
-                    print(f"  - {action.title()}: {print_source} -> {target_path}")
-                    total_processed_count += 1
-                    
-                except Exception as e:
-                    error_msg = str(e).replace('\n', ' ')
-                    log_entry[4] = f"ERROR ({action.title()} failed): {error_msg}"
-                    write_log_entry(log_entry, log_history_deque, app_instance)
-                    print(f"  - ERROR processing {source_path}: {error_msg}")
-
-        # --- Archive Mode Execution (Archive/Archive & Move) ---
-        elif mode == 'archive':
-            archive_base_name = key[2] 
-            source_name = os.path.basename(source_dir_norm)
-            archive_filename = f"{archive_base_name}.tar"
-            base_target_dir = os.path.join(target_dir, source_name, time_segment)
-            archive_path = os.path.join(base_target_dir, archive_filename)
+                    future = copy_executor.submit(_copy_file_task, source_path, filename, target_path, final_target_dir, action, current_runtime_str, file_stat)
+                    copy_futures[future] = print_source
+
+            # --- Archive Mode Execution (Archive/Archive & Move) ---
+            elif mode == 'archive':
+                archive_base_name = key[2] 
+                source_name = os.path.basename(source_dir_norm)
+                archive_filename = f"{archive_base_name}.tar"
+                base_target_dir = os.path.join(target_dir, source_name, time_segment)
+                archive_path = os.path.join(base_target_dir, archive_filename)
             
-            os.makedirs(base_target_dir, exist_ok=True)
+                _ensure_dir(base_target_dir)
             
-            tar_mode = "a" if os.path.exists(archive_path) else "w"
-            action_desc = "Appending" if tar_mode == "a" else "Creating"
-            print(f"[{current_runtime_str.split()[-1]}] {action_desc} archive: {archive_path}")
+                # Exclusive create tells us whether the archive already existed without a separate
+                # stat, and cannot race with another process creating it in between
+                try:
+                    os.close(os.open(archive_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                    tar_mode = "w"
+                except FileExistsError:
+                    # A 0-byte file is a placeholder left by a run that died before tarfile wrote to it
+                    tar_mode = "w" if os.path.getsize(archive_path) == 0 else "a"
+                except OSError:
+                    tar_mode = "w" # Not creatable (e.g. permissions): tarfile.open reports the error below
+                action_desc = "Appending" if tar_mode == "a" else "Creating"
+                print(f"[{current_runtime_str.split()[-1]}] {action_desc} archive: {archive_path}")
             
-            files_added_count = 0
+                files_added_count = 0
+                new_arcnames = []
+                
+                # Sidecar index of member names: lets a run that only finds already-archived
+                # files skip opening the tar (append mode re-reads every header on open)
+                files_in_archive = _load_archive_index(archive_path) if tar_mode == 'a' else set()
+                index_is_current = files_in_archive is not None
             
-            try:
-                with tarfile.open(archive_path, tar_mode) as tar:
-                    files_in_archive = {m.name for m in tar.getmembers()} if tar_mode == 'a' else set()
+                try:
+                    with contextlib.ExitStack() as stack:
+                        tar = None
+                        if not index_is_current:
+                            # Missing or stale index: the headers parsed on open rebuild it.
+                            # Append mode has already read every header into tar.members to find the
+                            # end of the archive, so getnames() costs no I/O; tar.next() would return
+                            # None here because the file position is already at the end.
+                            tar = stack.enter_context(tarfile.open(archive_path, tar_mode, copybufsize=TAR_COPY_BUFFER_SIZE))
+                            files_in_archive = set(tar.getnames())
                     
-                    for source_path, filename, mod_dt, rel_sub_path, mod_timestamp in files_to_handle:
-                        arcname = os.path.relpath(source_path, start=source_dir_norm)
-                        file_log_entry = [current_runtime_str, source_path, filename, archive_path, ""] 
-
-                        if arcname in files_in_archive:
-                            file_log_entry[4] = "SKIPPED (Already in archive)"
-                            write_log_entry(file_log_entry, log_history_deque, app_instance)
-                            continue 
+                        for source_path, filename, mod_timestamp, file_stat, is_link in zip(group['path'], group['name'], group['mtime_ts'], group['stat'], group['link']):
+                            arcname = os.path.relpath(source_path, start=source_dir_norm)
+                            file_log_entry = [current_runtime_str, source_path, filename, archive_path, ""] 
+
+                            if arcname in files_in_archive:
+                                file_log_entry[4] = "SKIPPED (Already in archive)"
+                                write_log_entry(file_log_entry, log_history_deque, app_instance)
+                                continue 
                         
-                        try:
-                            # 1. Add to archive
-                            tarinfo = tar.gettarinfo(source_path, arcname=arcname)
-                            tarinfo.mtime = mod_timestamp 
-                            
-                            with open(source_path, 'rb') as f:
-                                tar.addfile(tarinfo, f)
+                            if tar is None:
+                                tar = stack.enter_context(tarfile.open(archive_path, tar_mode, copybufsize=TAR_COPY_BUFFER_SIZE))
+                        
+                            try:
+                                # 1. Add to archive
+                                if is_link or not stat.S_ISREG(file_stat.st_mode):
+                                    # Symlinks are stored as links (gettarinfo lstat()s the path), and FIFOs or
+                                    # devices as headers only: opening a FIFO would block the worker
+                                    tarinfo = tar.gettarinfo(source_path, arcname)
+                                    if tarinfo is None:
+                                        raise ValueError("Unsupported file type (e.g. socket)")
+                                    if tarinfo.isreg(): # Replaced by a regular file since the scan
+                                        with open(source_path, 'rb') as f:
+                                            tar.addfile(tarinfo, f)
+                                    else:
+                                        tar.addfile(tarinfo)
+                                else:
+                                    # Built from the stat taken during the scan instead of re-statting via gettarinfo()
+                                    tarinfo = tarfile.TarInfo(name=arcname)
+                                    tarinfo.size = file_stat.st_size
+                                    tarinfo.mtime = mod_timestamp 
+                                    tarinfo.mode = file_stat.st_mode & 0o7777
+                                    tarinfo.uid = file_stat.st_uid
+                                    tarinfo.gid = file_stat.st_gid
+                                    tarinfo.uname, tarinfo.gname = _owner_names(file_stat.st_uid, file_stat.st_gid)
+                                
+                                    # Sequential readahead while streaming, then drop the pages so cold
+                                    # source data does not evict other cached files (no-op off Linux/BSD)
+                                    with open(source_path, 'rb', buffering=TAR_COPY_BUFFER_SIZE) as f:
+                                        if HAS_FADVISE:
+                                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                                        tar.addfile(tarinfo, f)
+                                        if HAS_FADVISE:
+                                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
                                 
-                            file_log_entry[4] = "SUCCESS (Archived)"
-                            files_added_count += 1
-                            total_processed_count += 1
+                                file_log_entry[4] = "SUCCESS (Archived)"
+                                new_arcnames.append(arcname)
+                                files_added_count += 1
+                                total_processed_count += 1
                             
-                            # 2. Handle 'move' logic for archiving
-                            if action == 'move':
-                                if mod_dt < delete_age_threshold:
-                                    remove_source_file(source_path, file_log_entry, log_history_deque, app_instance)
-                                else:
-                                    file_log_entry[4] += f" (Move SKIPPED, not older than {delete_age_days_int} days)"
-
-                            write_log_entry(file_log_entry, log_history_deque, app_instance)
+                                # 2. Handle 'move' logic for archiving
+                                if action == 'move':
+                                    if mod_timestamp < delete_age_threshold_ts:
+                                        remove_source_file(source_path, file_log_entry, log_history_deque, app_instance)
+                                    else:
+                                        file_log_entry[4] += f" (Move SKIPPED, not older than {delete_age_days_int} days)"
+
+                                write_log_entry(file_log_entry, log_history_deque, app_instance)
                             
-                        except Exception as file_e:
-                            file_error_msg = str(file_e).replace('\n', ' ')
-                            file_log_entry[4] = f"ERROR (Archiving failed): {file_error_msg}"
-                            write_log_entry(file_log_entry, log_history_deque, app_instance)
-                            print(f"  - ERROR archiving {filename}: {file_error_msg}")
+                            except Exception as file_e:
+                                file_error_msg = _sanitize(file_e)
+                                file_log_entry[4] = f"ERROR (Archiving failed): {file_error_msg}"
+                                write_log_entry(file_log_entry, log_history_deque, app_instance)
+                                print(f"  - ERROR archiving {filename}: {file_error_msg}")
+
+                    # Written after the tar is closed so the index is never older than the archive
+                    if tar is not None:
+                        if index_is_current and tar_mode == 'a':
+                            _update_archive_index(archive_path, new_arcnames)
+                        else:
+                            _update_archive_index(archive_path, files_in_archive.union(new_arcnames), rewrite=True)
 
-                if files_added_count > 0:
-                    print(f"  - Successfully completed {action_desc.lower()} {files_added_count} files to: {archive_path}")
+                    if files_added_count > 0:
+                        print(f"  - Successfully completed {action_desc.lower()} {files_added_count} files to: {archive_path}")
 
-            except Exception as e:
-                error_msg = str(e).replace('\n', ' ')
-                critical_log_entry = [current_runtime_str, source_dir_norm, archive_filename, archive_path, f"CRITICAL ERROR (Archive Failed): {error_msg}"]
-                write_log_entry(critical_log_entry, log_history_deque, app_instance)
-                print(f"  - CRITICAL ERROR during archiving {source_dir_norm}: {error_msg}")
+                except Exception as e:
+                    error_msg = _sanitize(e)
+                    critical_log_entry = [current_runtime_str, source_dir_norm, archive_filename, archive_path, f"CRITICAL ERROR (Archive Failed): {error_msg}"]
+                    write_log_entry(critical_log_entry, log_history_deque, app_instance)
+                    print(f"  - CRITICAL ERROR during archiving {source_dir_norm}: {error_msg}")
+                    # Drop an empty placeholder (from the exclusive create or an earlier failed run);
+                    # append mode cannot open a 0-byte file
+                    with contextlib.suppress(OSError):
+                        if os.path.getsize(archive_path) == 0:
+                            os.remove(archive_path)
+        # Results are logged on the calling thread so GUI history updates stay off the workers
+        for future in concurrent.futures.as_completed(copy_futures):
+            log_entry, error_msg = future.result()
+            write_log_entry(log_entry, log_history_deque, app_instance)
+            
+            if error_msg is None:
+                print(f"  - {action.title()}: {copy_futures[future]} -> {log_entry[3]}")
+                total_processed_count += 1
+            else:
+                print(f"  - ERROR processing {log_entry[1]}: {error_msg}")
+    finally:
+        if copy_executor is not None:
+            copy_executor.shutdown(wait=True)
+        # Persist any rows still buffered from this run
+        flush_log_buffer()
             
     print(f"[{current_runtime_str}] Operation run complete. Total items processed/archived: {total_processed_count}")
 
@@ -481,6 +915,7 @@ def run_cli_mode(alt_config_path=None, cli_mode_override=None, cli_action_overri
     
     config = load_config(alt_config_path)
     settings = config['Settings']
+    startup_time_str = datetime.now().strftime(TIME_FORMAT)
     
     source_dirs_str = settings.get('source_dirs', '')
     target_dir = settings.get('target_dir', '')
@@ -499,16 +934,16 @@ def run_cli_mode(alt_config_path=None, cli_mode_override=None, cli_action_overri
             raise ValueError("Delete age too low.")
 
     except ValueError as e:
-        print(f"[{datetime.now().strftime(TIME_FORMAT)}] CRITICAL ERROR: Invalid configuration value. Defaulting values.")
+        print(f"[{startup_time_str}] CRITICAL ERROR: Invalid configuration value. Defaulting values.")
         interval = DEFAULT_INTERVAL_MINUTES
         delete_age_days = DEFAULT_DELETE_AGE_DAYS
 
     if not all([source_dirs_str, target_dir, interval > 0]):
-        print(f"[{datetime.now().strftime(TIME_FORMAT)}] CRITICAL ERROR: Missing configuration values.")
+        print(f"[{startup_time_str}] CRITICAL ERROR: Missing configuration values.")
         sys.exit(1)
 
     print("-" * 50)
-    print(f"[{datetime.now().strftime(TIME_FORMAT)}] Starting Utility in CLI Mode")
+    print(f"[{startup_time_str}] Starting Utility in CLI Mode")
     print(f"  > Config File: {GLOBAL_CONFIG_FILE_PATH}")
     print(f"  > Log Prefix:  {GLOBAL_LOG_PREFIX}")
     print(f"  > Operation: {mode.upper()} / {action.upper()}")
@@ -526,18 +961,32 @@ def run_cli_mode(alt_config_path=None, cli_mode_override=None, cli_action_overri
     job_wrapper() 
     schedule.every(interval).minutes.do(job_wrapper)
     
+    # Only an interactive terminal needs the 1 Hz countdown; otherwise sleep until the next job is due
+    show_countdown = sys.stdout.isatty()
+    last_idle_secs = None
+    
     while True:
         try:
-            # Get idle seconds and convert to integer seconds
-            idle_secs = int(schedule.idle_seconds())
+            idle = schedule.idle_seconds()
             
-            # Use carriage return to overwrite the current line
-            sys.stdout.write(f"\rNext action in: {idle_secs:4d} seconds. Status: Idle.")
-            sys.stdout.flush()
-            
-            schedule.run_pending()
-            time.sleep(1)
+            if show_countdown:
+                # Get idle seconds and convert to integer seconds
+                idle_secs = int(idle) if idle is not None else 0
+                
+                # Use carriage return to overwrite the current line (only when the value changes)
+                if idle_secs != last_idle_secs:
+                    sys.stdout.write(f"\rNext action in: {idle_secs:4d} seconds. Status: Idle.")
+                    sys.stdout.flush()
+                    last_idle_secs = idle_secs
+                
+                schedule.run_pending()
+                time.sleep(1)
+            else:
+                schedule.run_pending()
+                idle = schedule.idle_seconds()
+                time.sleep(max(0.1, min(idle if idle is not None else CLI_MAX_IDLE_SLEEP_SECONDS, CLI_MAX_IDLE_SLEEP_SECONDS)))
         except KeyboardInterrupt:
+            flush_log_buffer()
             # Clear the status line before exiting
             sys.stdout.write('\r' + ' ' * 80 + '\r')
             sys.stdout.flush()
@@ -583,6 +1032,19 @@ def run_gui(alt_config_path=None):
             self.is_running = False
             self.log_history = LOG_HISTORY 
             self.current_job_status = "Ready" 
+            self._shown_rows = deque() # Mirror of the rows in log_tree, see update_log_display
+            self._interval_minutes = None # Interval of the running job
+            self._next_run = None # Cached next run time (avoids schedule.next_run() every tick)
+            self._last_status_text = None # Last countdown text written to status_var
+            self._worker = None # Thread running process_files
+            self._event_queue = queue.Queue() # Log rows from the worker, drained on the Tk thread
+            self._source_dirs_cache = None # Parsed source_text, reset on edit
+            self._last_saved_settings = None # Field values written by the last save_settings
+            self._visible = True # False while the window is minimized (see _on_map_change)
+            self._closing = False # Set once the window close was requested (see on_close)
+            self.master.bind("<Map>", self._on_map_change)
+            self.master.bind("<Unmap>", self._on_map_change)
+            self.master.protocol("WM_DELETE_WINDOW", self.on_close)
             
             self.create_widgets()
             self.load_settings()
@@ -626,8 +1088,10 @@ def run_gui(alt_config_path=None):
             
             # Row 4: Source Dirs (Height reduced from 4 to 3 lines)
             tk.Label(self, text=f"Source Dirs (1 per line or ; separated, use '{PATH_SEP_HINT}'):").grid(row=current_row, column=0, sticky="nw", pady=2)
-            self.source_text = ScrolledText(self, width=60, height=3) 
+            # Short path list: no undo history, no per-keystroke wrap recomputation
+            self.source_text = ScrolledText(self, width=60, height=3, undo=False, autoseparators=False, maxundo=0, wrap='none') 
             self.source_text.grid(row=current_row, column=1, columnspan=2, pady=2, sticky="ew")
+            self.source_text.bind("<<Modified>>", self._on_source_text_modified)
             current_row += 1
             
             # Row 5: Target Directory
@@ -686,24 +1150,38 @@ def run_gui(alt_config_path=None):
             tk.Label(self, text=f"Last {LOG_HISTORY_LIMIT} Events (Source File Name/Archive):").grid(row=current_row, column=0, columnspan=3, sticky="w", pady=5)
             current_row += 1
             
+            # Row 13: Treeview Display Section, built on first job start (see _ensure_log_widgets)
+            self._log_row = current_row
+            self.log_tree = None
+            self._log_placeholder = ttk.Label(self, text="Log appears when the operation starts.")
+            self._log_placeholder.grid(row=current_row, column=0, columnspan=3, sticky="nw", padx=5, pady=5)
+            
+        def _ensure_log_widgets(self):
+            """Creates the Treeview log section on first use, replacing the placeholder label."""
+            if self.log_tree is not None:
+                return
+            self._log_placeholder.destroy()
+            
             # Row 13: Treeview Display Section (This will expand vertically to fill the remaining space)
             tree_frame = ttk.Frame(self)
-            tree_frame.grid(row=current_row, column=0, columnspan=3, sticky="nsew", padx=5, pady=5)
+            tree_frame.grid(row=self._log_row, column=0, columnspan=3, sticky="nsew", padx=5, pady=5)
             tree_frame.grid_rowconfigure(0, weight=1)
             tree_frame.grid_columnconfigure(0, weight=1)
 
             # NOTE: Height is kept default or slightly reduced to fit 650 constraint.
             self.log_tree = ttk.Treeview(tree_frame, columns=TREE_COLUMNS, show='headings') 
             
-            # Configure Columns 
+            # Configure Columns (one pass: column and heading options per column)
+            column_options = {
+                "Time": dict(width=70, minwidth=60, stretch=tk.NO, anchor=tk.CENTER),
+                "Source File Name": dict(width=160, minwidth=100, stretch=tk.YES),
+                "Source Path": dict(width=160, minwidth=100, stretch=tk.YES),
+                "Target Path/Archive": dict(width=160, minwidth=100, stretch=tk.YES),
+                "Status": dict(width=100, minwidth=70, stretch=tk.YES),
+            }
             self.log_tree.column("#0", width=0, stretch=tk.NO) 
-            self.log_tree.column("Time", width=70, minwidth=60, stretch=tk.NO, anchor=tk.CENTER)
-            self.log_tree.column("Source File Name", width=160, minwidth=100, stretch=tk.YES) 
-            self.log_tree.column("Source Path", width=160, minwidth=100, stretch=tk.YES)
-            self.log_tree.column("Target Path/Archive", width=160, minwidth=100, stretch=tk.YES) 
-            self.log_tree.column("Status", width=100, minwidth=70, stretch=tk.YES)
-            
             for col in TREE_COLUMNS:
+                self.log_tree.column(col, **column_options[col])
                 self.log_tree.heading(col, text=col.replace(" Name", ""), anchor=tk.W)
             
             self.log_tree.grid(row=0, column=0, sticky="nsew")
@@ -712,8 +1190,11 @@ def run_gui(alt_config_path=None):
             self.log_tree.configure(yscrollcommand=vsb.set)
             vsb.grid(row=0, column=1, sticky='ns')
             
-            style = ttk.Style(self)
-            style.configure("Error.Treeview", foreground="red")
+            # Row color for the 'Error' tag set in update_log_display (configured once per tree)
+            self.log_tree.tag_configure('Error', foreground='red')
+            
+            # Show any history gathered before the widgets existed
+            self.update_log_display()
             
         def browse_dir(self, var):
             directory = filedialog.askdirectory()
@@ -721,9 +1202,16 @@ def run_gui(alt_config_path=None):
                 var.set(directory)
 
         def get_source_dirs_from_text(self):
-            content = self.source_text.get("1.0", tk.END).strip()
-            source_dirs = ';'.join([d.strip() for line in content.splitlines() for d in line.split(';') if d.strip()])
-            return source_dirs
+            # Parsed once per edit of the text box (see _on_source_text_modified)
+            if self._source_dirs_cache is None:
+                content = self.source_text.get("1.0", tk.END)
+                self._source_dirs_cache = ';'.join(filter(None, (d.strip() for d in content.translate(_NL_TO_SEMI).split(';'))))
+            return self._source_dirs_cache
+        
+        def _on_source_text_modified(self, event=None):
+            self._source_dirs_cache = None
+            # <<Modified>> only fires when the flag flips, so re-arm it for the next edit
+            self.source_text.edit_modified(False)
 
         def load_settings(self):
             settings = self.config['Settings']
@@ -764,28 +1252,79 @@ def run_gui(alt_config_path=None):
                     messagebox.showerror("Error", "All configuration fields must be filled.")
                     return
 
+                # Skip the disk write when nothing changed since the last save from this window
+                settings_tuple = (source_dirs_str, target, interval, patterns, mode, action, delete_age_days, log_dir, log_prefix)
+                if settings_tuple == self._last_saved_settings and os.path.exists(GLOBAL_CONFIG_FILE_PATH):
+                    messagebox.showinfo("Info", f"Settings unchanged; {GLOBAL_CONFIG_FILE_PATH} is already up to date.")
+                    return
+
                 # Save the config (this updates the GLOBAL_LOG_DIR and GLOBAL_LOG_PREFIX)
-                save_config(source_dirs_str, target, interval, patterns, mode, action, delete_age_days, log_dir, log_prefix)
+                save_config(*settings_tuple)
+                self._last_saved_settings = settings_tuple
                 messagebox.showinfo("Success", f"Settings saved successfully to {GLOBAL_CONFIG_FILE_PATH}.")
                 
             except ValueError:
                 messagebox.showerror("Error", "Interval and Delete Age must be valid numbers.")
 
         def update_log_display(self):
-            """Clears and re-populates the Treeview with the current log_history."""
+            """
+            Syncs the Treeview with log_history by only inserting new rows and deleting evicted ones.
+            log_history is newest-first (appendleft, maxlen); the tree shows oldest at the top.
+            """
+            if self.log_tree is None:
+                return # Not built yet; _ensure_log_widgets syncs on creation
+            
+            history = self.log_history
+            shown = self._shown_rows # Rows currently in the tree, newest first (iid = id(row))
+            
+            # Nothing changed since the last sync
+            if len(history) == len(shown) and (not shown or history[0] is shown[0]):
+                return
             
-            for item in self.log_tree.get_children():
-                self.log_tree.delete(item)
+            # Count the rows added since the last sync (everything before the previous head)
+            new_count = len(history)
+            if shown:
+                head = shown[0]
+                for i, row in enumerate(history):
+                    if row is head:
+                        new_count = i
+                        break
             
-            for row in self.log_history:
-                tags = ()
-                if row[4].startswith("ERROR") or row[4].startswith("CRITICAL") or "(ERROR DELETING SOURCE:" in row[4]: 
-                    tags = ('Error',)
+            # Follow the newest rows (appended at the bottom) unless the user scrolled up
+            follow_newest = self.log_tree.yview()[1] >= 1.0
+            
+            if new_count == len(history):
+                # Previous head is gone (or first call): rebuild
+                if shown:
+                    self.log_tree.delete(*self.log_tree.get_children())
+                shown.clear()
+            else:
+                # Rows evicted from the end of the deque are the oldest, at the top of the tree
+                keep = len(history) - new_count
+                while len(shown) > keep:
+                    self.log_tree.delete(str(id(shown.pop())))
+            
+            for i in range(new_count - 1, -1, -1):
+                row = history[i]
+                tags = ('Error',) if row[5] else ()
                 
-                self.log_tree.insert('', 0, values=row, tags=tags)
+                # Holding the row in shown keeps id(row) unique while it is in the tree
+                self.log_tree.insert('', 'end', iid=str(id(row)), values=row[:5], tags=tags)
+                shown.appendleft(row)
+            
+            if follow_newest:
+                self.log_tree.yview_moveto(1.0)
                 
         def run_copy_wrapper(self):
-            """Wrapper for the copy function to run within the schedule."""
+            """Wrapper for the copy function to run within the schedule; process_files runs on a worker thread."""
+            # schedule counts the next run from now even when this run is skipped below; mirror that here
+            if self._interval_minutes is not None:
+                self._next_run = datetime.now() + timedelta(minutes=self._interval_minutes)
+            
+            if self._worker is not None and self._worker.is_alive():
+                print(f"[{datetime.now().strftime(TIME_FORMAT)}] Previous operation still running, skipping this run.")
+                return
+            
             source_dirs_str = self.get_source_dirs_from_text()
             target = self.target_var.get()
             patterns = self.patterns_var.get()
@@ -801,12 +1340,41 @@ def run_gui(alt_config_path=None):
             # Set base status to 'Processing...'
             self.current_job_status = f"Processing ({mode.upper()}/{action.upper()})..."
             self.status_var.set(self.current_job_status)
-            self.master.update()
+            self._last_status_text = None
+            
+            self._worker = threading.Thread(
+                target=process_files,
+                args=(source_dirs_str, target, patterns, mode, action, delete_age_days, self.log_history, self),
+                daemon=True
+            )
+            self._worker.start()
+            self.master.after(GUI_EVENT_DRAIN_MS, lambda: self._drain_events(f"Running ({mode.upper()}/{action.upper()} Mode)"))
+        
+        def post_log_row(self, gui_row):
+            """Thread-safe: queues a log row for the Tk thread."""
+            self._event_queue.put(gui_row)
+        
+        def _drain_events(self, done_status):
+            """Applies queued log rows in batches until the worker has finished, then restores the status."""
+            applied = 0
+            try:
+                while applied < GUI_EVENT_BATCH:
+                    self.log_history.appendleft(self._event_queue.get_nowait())
+                    applied += 1
+            except queue.Empty:
+                pass
             
-            process_files(source_dirs_str, target, patterns, mode, action, delete_age_days, self.log_history, self)
+            if applied:
+                self.update_log_display()
             
-            # Set base status to 'Running' after job completion
-            self.current_job_status = f"Running ({mode.upper()}/{action.upper()} Mode)"
+            if applied == GUI_EVENT_BATCH or self._worker.is_alive():
+                self.master.after(GUI_EVENT_DRAIN_MS, lambda: self._drain_events(done_status))
+            elif self.current_job_status.startswith("Processing"):
+                # Set base status to 'Running' after job completion (unless stopped meanwhile)
+                self.current_job_status = done_status if self.is_running else "Stopped"
+                self._last_status_text = None
+                if not self.is_running:
+                    self.status_var.set(f"Status: {self.current_job_status}")
         
         def toggle_copy_job(self):
             """Starts or stops the scheduled copy job."""
@@ -816,6 +1384,8 @@ def run_gui(alt_config_path=None):
                 self.is_running = False
                 self.control_button_var.set("Start Operation")
                 self.current_job_status = "Stopped"
+                self._interval_minutes = None
+                self._next_run = None
                 self.status_var.set(f"Status: {self.current_job_status}")
                 print("Operation job stopped.")
             else:
@@ -845,14 +1415,16 @@ def run_gui(alt_config_path=None):
                     global GLOBAL_LOG_PREFIX
                     GLOBAL_LOG_PREFIX = log_prefix
                     
+                    self._interval_minutes = interval
+                    self._last_status_text = None
+                    self._ensure_log_widgets()
                     # Run immediately, then schedule
                     self.run_copy_wrapper() 
                     self.job = schedule.every(interval).minutes.do(self.run_copy_wrapper)
                     
                     self.is_running = True
                     self.control_button_var.set("Stop Operation")
-                    # Set base status to be updated by check_schedule
-                    self.current_job_status = f"Running ({mode.upper()}/{action.upper()} Mode)"
+                    # current_job_status stays "Processing" until _drain_events sees the first run finish
                     print(f"Operation job started in {mode.upper()}/{action.upper()} mode, running every {interval} minutes.")
                     
                     self.master.after(100, self.check_schedule) # Start the countdown loop
@@ -860,24 +1432,64 @@ def run_gui(alt_config_path=None):
                 except ValueError:
                     messagebox.showerror("Error", f"Interval and Delete Age must be valid numbers.")
                 
+        def on_close(self):
+            """Stops the schedule and closes the window once a running operation has finished."""
+            if self._closing:
+                return
+            self._closing = True
+            schedule.clear()
+            self.is_running = False
+            if self._worker is not None and self._worker.is_alive():
+                self.control_button.config(state=tk.DISABLED)
+                self.status_var.set("Status: Closing (waiting for the current operation to finish)...")
+            self._close_when_idle()
+        
+        def _close_when_idle(self):
+            # Ending the worker thread mid-copy would leave a truncated file or tar archive behind
+            if self._worker is not None and self._worker.is_alive():
+                self.master.after(GUI_EVENT_DRAIN_MS, self._close_when_idle)
+                return
+            flush_log_buffer() # Rows still below LOG_FLUSH_THRESHOLD
+            self.master.destroy()
+        
+        def _on_map_change(self, event):
+            # Toplevel bindings also see child widget events; only the window itself matters
+            if event.widget is self.master:
+                self._visible = event.type == tk.EventType.Map
+                if self._visible:
+                    self._last_status_text = None # Label may be stale; redraw on the next tick
+        
         def check_schedule(self):
             """Checks the schedule, runs pending jobs, and updates the countdown."""
             if self.is_running:
                 schedule.run_pending()
                 
+                # Minimized/unmapped: nobody sees the countdown, so only wake for the next run
+                if not self._visible:
+                    delay_ms = GUI_HIDDEN_POLL_MS
+                    if self._next_run:
+                        ms_until_next = int((self._next_run - datetime.now()).total_seconds() * 1000)
+                        delay_ms = max(100, min(delay_ms, ms_until_next))
+                    self.master.after(delay_ms, self.check_schedule)
+                    return
+                
                 # Update countdown only if not actively processing
                 if not self.current_job_status.startswith("Processing"):
-                    next_run_time = schedule.next_run()
-                    if next_run_time:
-                        time_until_next = (next_run_time - datetime.now()).total_seconds()
+                    if self._next_run:
+                        time_until_next = (self._next_run - datetime.now()).total_seconds()
                         if time_until_next > 0:
                             countdown_sec = int(time_until_next)
-                            self.status_var.set(f"Status: {self.current_job_status} | Next Run in: {countdown_sec} seconds")
+                            status_text = f"Status: {self.current_job_status} | Next Run in: {countdown_sec} seconds"
                         else:
                             # Should happen rarely, if job is overdue
-                            self.status_var.set(f"Status: {self.current_job_status} | Next Run: Due Now")
+                            status_text = f"Status: {self.current_job_status} | Next Run: Due Now"
                     else:
-                        self.status_var.set(f"Status: {self.current_job_status} | No Next Job Scheduled")
+                        status_text = f"Status: {self.current_job_status} | No Next Job Scheduled"
+                    
+                    # Only touch the Tk variable (and redraw the label) when the text changed
+                    if status_text != self._last_status_text:
+                        self.status_var.set(status_text)
+                        self._last_status_text = status_text
                 
                 self.master.after(1000, self.check_schedule) # Rerun every 1 second
 
@@ -921,7 +1533,7 @@ if __name__ == "__main__":
     parser.add_argument(
         '--hiden-import', 
         action='store_true', 
-        help="Hint for PyInstaller: additional modules to include are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk', 'tarfile', 'fnmatch'."
+        help="Hint for PyInstaller: additional modules to include are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk', 'tarfile', 'fnmatch', 're', 'concurrent.futures', 'json', 'queue'."
     )
     
     args = parser.parse_args()
@@ -25,7 +25,12 @@ Generated on: 2025-09-26 13:23:25 +07
         3. **target absolute path (Absolute path to the copied file location)**
         4. action date/time (Timestamp of when the copy operation occurred)
         5. **status / error message (SUCCESS or exception details)**
+- **Skip Unchanged:** A file whose target already exists with the same size and modification time is not 
+  copied again. Such skips are only logged when 'log_skipped = true' is set in config.ini.
+- **Console Output:** Per-source summaries only; set 'verbose = true' in config.ini to print every copied file.
 - **GUI Feature:** Displays the last 100 copy events in a grid view, highlighting errors in red.
+  On start it is filled from the tail of today's log file.
+  The GUI lives in 'secopy_gui.py' (same folder) and is only imported in GUI mode.
 
 Usage:
   python interval_copy_util.py           (Runs the GUI)
@@ -36,7 +41,7 @@ Options:
   --cli            Run the application in command line mode (loads config/config.ini and starts the scheduled job).
   --help, -h       Show this help message and exit.
   --hiden-import   This hint is for PyInstaller: additional modules to include 
-                   are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk'.
+                   are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk', 'ctypes', 'fnmatch', 're', 'concurrent.futures', 'multiprocessing'.
 """
 
 import sys
@@ -44,10 +49,17 @@ import os
 import shutil
 import time
 import argparse
+import atexit
 import configparser
 import csv
+import io
+import concurrent.futures
+import multiprocessing
+import fnmatch
+import re
+import ctypes
 from datetime import datetime
-from collections import deque # To manage the 100-file history efficiently
+from collections import deque, Counter # deque manages the 100-file history efficiently
 
 # Non-standard module needed:
 # If 'schedule' is missing, install it with: pip install schedule
@@ -63,6 +75,8 @@ except ImportError:
 CONFIG_DIR = 'config'
 TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 LOG_HISTORY_LIMIT = 100 # Limit for the GUI display
+MAX_IDLE_SLEEP_SECONDS = 30 # Upper bound for one scheduler sleep (CLI loop and GUI check_schedule)
+LOG_REFRESH_MS = 200 # GUI log refreshes are coalesced to at most one per this interval
 
 # New log file naming convention with date
 TODAY_DATE_STR = datetime.now().strftime('%y%m%d')
@@ -82,10 +96,34 @@ TREE_COLUMNS = ['Time', 'File Name', 'Source Path', 'Target Path', 'Status']
 IS_WINDOWS = os.name == 'nt'
 PATH_SEP_HINT = os.sep # Use os.sep ('\' or '/')
 TIME_SUBDIR_FORMAT = f'%Y{os.sep}%m{os.sep}%d{os.sep}%H'
+# Cache bucket for formatted time sub-dirs. 15 minutes divides every real UTC offset, so a bucket
+# never straddles a local hour boundary (plain ts // 3600 would for e.g. +05:30).
+TIME_BUCKET_SECONDS = 900
+TIME_SUB_CACHE_LIMIT = 4096 # Entries kept between runs before the cache is reset
+
+# Max bytes per kernel copy call (os.copy_file_range / os.sendfile); loops until EOF
+KERNEL_COPY_CHUNK = 1 << 30
+# Buffer for the portable read/write fallback (shutil's default is 64 KiB, 16 KiB on older Pythons).
+# Larger buffers help HDDs and SMB mounts; beyond a few MiB they mostly just use more memory.
+COPY_BUFFER_SIZE = 1 << 20
+# Concurrent file copies per run (I/O bound; the copy syscalls release the GIL)
+COPY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+COPY_QUEUE_LIMIT = COPY_WORKERS * 4 # Max submitted-but-unlogged copies while scanning
+
+# Config 'log_skipped': also log files skipped because the target is already up to date
+LOG_SKIPPED = False
+# Config 'verbose': print one line per copied file (off by default; per-source summaries are always printed)
+VERBOSE = False
 
 # Global Deque to store log history for GUI (used if GUI is running)
 LOG_HISTORY = deque(maxlen=LOG_HISTORY_LIMIT)
 
+# CSV log batching: rows are formatted as they are queued and written through a handle kept open for the current day
+LOG_FLUSH_ROWS = 256 # Flush once this many rows are pending (and at the end of every copy run)
+LOG_WRITE_BUFFER_SIZE = 1 << 20
+LOG_TAIL_BLOCK_SIZE = 64 * 1024 # The GUI reads today's log backwards in blocks of this size on start
+_LOG_STATE = {'date_str': None, 'fh': None, 'pending': []}
+
 # --- Core Logic ---
 
 def configure_config_file():
@@ -95,6 +133,7 @@ def configure_config_file():
 
 def load_config():
     """Loads configuration from the config file."""
+    global LOG_SKIPPED, VERBOSE
     config = configparser.ConfigParser()
     config_file = configure_config_file()
     
@@ -110,6 +149,15 @@ def load_config():
             'file_patterns': '*.txt;*.log', # Example patterns
         }
     
+    try:
+        LOG_SKIPPED = config['Settings'].getboolean('log_skipped', fallback=False)
+    except (KeyError, ValueError):
+        LOG_SKIPPED = False
+    try:
+        VERBOSE = config['Settings'].getboolean('verbose', fallback=False)
+    except (KeyError, ValueError):
+        VERBOSE = False
+    
     return config
 
 def save_config(source_dirs, target_dir, interval_minutes, file_patterns):
@@ -120,6 +168,8 @@ def save_config(source_dirs, target_dir, interval_minutes, file_patterns):
         'target_dir': target_dir,
         'interval_minutes': str(interval_minutes),
         'file_patterns': file_patterns,
+        'log_skipped': 'true' if LOG_SKIPPED else 'false',
+        'verbose': 'true' if VERBOSE else 'false',
     }
     
     with open(configure_config_file(), 'w') as configfile:
@@ -127,144 +177,426 @@ def save_config(source_dirs, target_dir, interval_minutes, file_patterns):
     
     print(f"Configuration saved to {CONFIG_FILE}")
 
-def write_log_entry(data_row, log_history_deque=None, app_instance=None):
+def _close_log_file():
+    """Closes the cached daily log handle (if any)."""
+    if _LOG_STATE['fh'] is not None:
+        try:
+            _LOG_STATE['fh'].close()
+        finally:
+            _LOG_STATE.update(date_str=None, fh=None)
+
+def _format_row(row):
     """
-    Writes a single row to the CSV log file and, if GUI is running, updates the in-memory history.
-    
-    data_row: [source folder, file name, target absolute path, action date/time, status / error message]
+    Formats one log row exactly like csv.writer(quoting=csv.QUOTE_ALL): every field quoted,
+    embedded quotes doubled, CRLF line end. Only fields containing a quote need escaping.
     """
-    
-    # 1. Write to permanent CSV log file
-    LOG_FILE_DAILY = os.path.join(CONFIG_DIR, f'copy_log_{datetime.now().strftime("%y%m%d")}.csv')
-    file_exists = os.path.exists(LOG_FILE_DAILY)
+    return '"' + '","'.join(f.replace('"', '""') if '"' in f else f for f in row) + '"\r\n'
+
+LOG_HEADER_BYTES = _format_row(LOG_HEADER).encode('utf-8')
+
+# Preformatted CSV line for the common case: a successful copy whose paths contain no quotes
+_SUCCESS_TMPL = '"{}","{}","{}","{}","SUCCESS"\r\n'
+
+def _csv_line(row):
+    """Returns the CSV line for one log row, using _SUCCESS_TMPL when no field needs escaping."""
+    if row[4] == "SUCCESS" and '"' not in row[0] and '"' not in row[2]:
+        # The file name is part of the source path, and the timestamp never contains a quote
+        return _SUCCESS_TMPL.format(row[0], row[1], row[2], row[3])
+    return _format_row(row)
+
+def flush_log_buffer():
+    """Writes all pending log rows to the daily CSV file, rotating the cached handle when the date changes."""
+    pending = _LOG_STATE['pending']
+    if not pending:
+        return
     
     try:
-        with open(LOG_FILE_DAILY, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-            
-            if not file_exists:
-                writer.writerow(LOG_HEADER)
-            
-            writer.writerow(data_row)
-            
+        date_str = datetime.now().strftime('%y%m%d')
+        if date_str != _LOG_STATE['date_str']:
+            _close_log_file()
+            log_file_daily = os.path.join(CONFIG_DIR, f'copy_log_{date_str}.csv')
+            fh = open(log_file_daily, 'ab', buffering=LOG_WRITE_BUFFER_SIZE)
+            # Append mode starts at the end of the file, so tell() == 0 means a new (empty) log
+            if fh.tell() == 0:
+                fh.write(LOG_HEADER_BYTES)
+            _LOG_STATE.update(date_str=date_str, fh=fh)
+        
+        # Lines were formatted when queued (no csv module); one write call per flush
+        _LOG_STATE['fh'].write(''.join(pending).encode('utf-8'))
+        _LOG_STATE['fh'].flush()
+        
     except Exception as e:
         print(f"[{datetime.now().strftime(TIME_FORMAT)}] CRITICAL ERROR writing to log: {e}")
+    finally:
+        pending.clear()
+
+def _shutdown_log():
+    flush_log_buffer()
+    _close_log_file()
+
+atexit.register(_shutdown_log)
+
+def _gui_row(data_row):
+    """Maps a log row to the GUI columns: (Time, File Name, Source Path, Target Path, Status)."""
+    return (
+        data_row[3].split()[-1], # Time only
+        data_row[1],             # File Name
+        data_row[0],             # Source Path (full path)
+        data_row[2],             # Target Path (absolute path)
+        data_row[4]              # Status / Error Message
+    )
+
+def load_log_history(log_history_deque):
+    """
+    Fills the GUI history with the newest rows of today's CSV log. Only the tail of the file is read
+    (backwards, LOG_TAIL_BLOCK_SIZE at a time), so the cost does not grow with the size of the log.
+    """
+    limit = log_history_deque.maxlen or LOG_HISTORY_LIMIT
+    log_file_daily = os.path.join(CONFIG_DIR, f'copy_log_{datetime.now().strftime("%y%m%d")}.csv')
+    
+    try:
+        with open(log_file_daily, 'rb') as fh:
+            pos = fh.seek(0, os.SEEK_END)
+            data = b''
+            while pos > 0 and data.count(b'\n') <= limit:
+                step = min(LOG_TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                fh.seek(pos)
+                data = fh.read(step) + data
+    except OSError:
+        return # No log yet today
+    
+    if pos > 0:
+        data = data[data.find(b'\n') + 1:] # Drop the partial first line
+    
+    try:
+        rows = [row for row in csv.reader(io.StringIO(data.decode('utf-8', errors='replace'), newline=''))
+                if len(row) == len(LOG_HEADER) and row != LOG_HEADER and row[3].split()] # _gui_row needs a time
+    except csv.Error as e:
+        print(f"[{datetime.now().strftime(TIME_FORMAT)}] WARNING: Could not read {log_file_daily}: {e}")
+        return
+    
+    for data_row in rows[-limit:]:
+        log_history_deque.appendleft(_gui_row(data_row)) # Newest ends up first
+
+def write_log_entry(data_row, log_history_deque=None, app_instance=None):
+    """
+    Queues a single row for the CSV log file and, if GUI is running, updates the in-memory history.
+    
+    data_row: (source folder, file name, target absolute path, action date/time, status / error message)
+    """
+    
+    # 1. Queue for the permanent CSV log file (written in batches by flush_log_buffer)
+    _LOG_STATE['pending'].append(_csv_line(data_row))
+    if len(_LOG_STATE['pending']) >= LOG_FLUSH_ROWS:
+        flush_log_buffer()
 
     # 2. Update in-memory log history for GUI display
     if log_history_deque is not None:
         # We only store the relevant fields for the GUI display
-        gui_row = [
-            data_row[3].split()[-1], # Time only
-            data_row[1],             # File Name
-            data_row[0],             # Source Path (full path)
-            data_row[2],             # Target Path (absolute path)
-            data_row[4]              # Status / Error Message
-        ]
-        log_history_deque.appendleft(gui_row) # Add to the start (most recent)
+        log_history_deque.appendleft(_gui_row(data_row)) # Add to the start (most recent)
         
         # Signal the GUI to update (if the app instance is passed)
         if app_instance is not None:
             app_instance.update_log_display()
 
 
-def interval_copy_files(source_dirs_str, target_dir, file_patterns, log_history_deque=None, app_instance=None):
+def _fast_copy(src, dst):
     """
-    Core function to copy files recursively and log the output.
-    Takes optional log_history_deque and app_instance for GUI integration.
+    Copies a file without bouncing the data through Python buffers: CopyFileW on Windows,
+    os.copy_file_range (allows reflinks) then os.sendfile elsewhere. Falls back to
+    a buffered copy when no kernel path works. Metadata (mtime) is preserved like copy2.
     """
-    source_dirs = [d.strip() for d in source_dirs_str.split(';') if d.strip()]
-    
-    if not source_dirs:
-        print(f"[{datetime.now().strftime(TIME_FORMAT)}] WARNING: No source directories configured. Skipping copy.")
+    if IS_WINDOWS:
+        # CopyFileW also copies timestamps and attributes; on failure let the fallback raise the real error
+        if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            _copy_buffered(src, dst)
         return
-
-    patterns = [p.strip() for p in file_patterns.split(';') if p.startswith('*')]
-    total_copied_count = 0
-    target_dir = os.path.normpath(os.path.abspath(target_dir))
     
-    for source_dir in source_dirs:
-        source_dir_norm = os.path.normpath(os.path.abspath(source_dir))
-        source_name = os.path.basename(source_dir_norm)
-        
-        if not os.path.isdir(source_dir_norm):
-            print(f"[{datetime.now().strftime(TIME_FORMAT)}] ERROR: Source directory not found: {source_dir_norm}")
-            continue
+    done = False
+    in_fd = os.open(src, os.O_RDONLY)
+    try:
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while os.copy_file_range(in_fd, out_fd, KERNEL_COPY_CHUNK) > 0:
+                        pass
+                    done = True
+                except OSError:
+                    pass
             
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Processing source (including subfolders): {source_dir_norm}")
-        copied_from_source = 0
-        source_base_prefix = source_dir_norm.rstrip(os.sep) + os.sep
+            # Kernel copies advance both file offsets, so sendfile resumes where copy_file_range stopped
+            if not done and hasattr(os, 'sendfile'):
+                try:
+                    while os.sendfile(out_fd, in_fd, None, KERNEL_COPY_CHUNK) > 0:
+                        pass
+                    done = True
+                except OSError:
+                    pass
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    
+    if done:
+        shutil.copystat(src, dst)
+    else:
+        _copy_buffered(src, dst)
+
+def _copy_buffered(src, dst):
+    """Portable fallback (network/FUSE mounts): copies in COPY_BUFFER_SIZE chunks, then the metadata like copy2."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+
+def _scan_tree(root_dir):
+    """
+    Recursively yields (DirEntry, relative_sub_path) for every file below root_dir.
+    Mirrors os.walk() (no descent into symlinked dirs, unreadable dirs skipped) but keeps
+    each DirEntry so its cached stat data can be reused by the caller.
+    """
+    stack = [(root_dir, '.')]
+    while stack:
+        current_dir, rel_sub_path = stack.pop()
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if not is_dir:
+                        yield entry, rel_sub_path
+                    elif not entry.is_symlink():
+                        child_rel = entry.name if rel_sub_path == '.' else os.path.join(rel_sub_path, entry.name)
+                        stack.append((entry.path, child_rel))
+        except OSError:
+            continue
+
+def _compile_patterns(patterns):
+    """
+    Splits glob patterns into a frozenset of plain '*.ext' suffixes (one set lookup per file)
+    and a single compiled regex for everything else (None if there is nothing else).
+    Patterns and file names are compared after os.path.normcase, like fnmatch.fnmatch().
+    """
+    suffix_set = set()
+    other_patterns = []
+    for p in patterns:
+        p = os.path.normcase(p)
+        ext = p[1:]
+        if p.startswith('*.') and not any(c in ext[1:] for c in '*?[.'):
+            suffix_set.add(ext)
+        else:
+            other_patterns.append(p)
+    
+    glob_re = re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in other_patterns)) if other_patterns else None
+    return frozenset(suffix_set), glob_re
+
+def _copy_one(source_path, final_target_dir, target_path, src_size, mod_timestamp, created_dirs):
+    """
+    Copy worker task: creates the target folder and copies one file (raises on failure).
+    Returns 'skipped' if the target already has the same size and mtime, else 'copied'.
+    created_dirs is the per-run set of target folders already created.
+    """
+    try:
+        target_stat = os.stat(target_path)
+    except OSError:
+        target_stat = None
+    
+    # Copies keep the source mtime, and the target path is derived from it, so a match means unchanged
+    if target_stat and target_stat.st_size == src_size and abs(target_stat.st_mtime - mod_timestamp) < 1.0:
+        return 'skipped'
+    
+    # Files cluster in the same hour folders, so most calls skip the makedirs syscalls.
+    # Workers may race on a new folder; exist_ok makes the duplicate call harmless.
+    if final_target_dir not in created_dirs:
+        os.makedirs(final_target_dir, exist_ok=True)
+        created_dirs.add(final_target_dir)
+    _fast_copy(source_path, target_path)
+    return 'copied'
+
+def _log_copy_result(future, source_path, filename, target_path, action_time, print_source, log_row):
+    """Logs the outcome of one submitted copy via log_row(row). Returns 'copied', 'skipped' or 'error'."""
+    try:
+        outcome = future.result()
+    except Exception as e:
+        # ERROR LOGGING
+        error_msg = str(e).replace('\n', ' ')
+        log_row((source_path, filename, target_path, action_time, f"ERROR: {error_msg}"))
+
+        print(f"  - ERROR processing {source_path}: {error_msg}")
+        return 'error'
+    
+    if outcome == 'skipped':
+        if LOG_SKIPPED:
+            log_row((source_path, filename, target_path, action_time, "SKIPPED (Target up to date)"))
+        return outcome
+    
+    # SUCCESS LOGGING
+    log_row((source_path, filename, target_path, action_time, "SUCCESS"))
+    
+    if VERBOSE:
+        print(f"  - Copied: {print_source} -> {target_path}")
+    return outcome
+
+def _copy_source(source_dir, target_dir, suffix_set, glob_re, log_row):
+    """
+    Walks one source directory and copies matching files on a thread pool.
+    Every log row is passed to log_row(entry) on the calling thread. Returns the number of files copied.
+    """
+    source_dir_norm = os.path.normpath(os.path.abspath(source_dir))
+    source_name = os.path.basename(source_dir_norm)
+    
+    if not os.path.isdir(source_dir_norm):
+        print(f"[{datetime.now().strftime(TIME_FORMAT)}] ERROR: Source directory not found: {source_dir_norm}")
+        return 0
         
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] Processing source (including subfolders): {source_dir_norm}")
+    outcomes = Counter() # 'copied' / 'skipped' / 'error' for this source
+    source_target_root = os.path.join(target_dir, source_name) # Per-source prefix, joined once
+    target_dir_cache = {} # (time bucket, rel_sub_path) -> final target folder for this source
+    created_dirs = set() # Target folders created for this source
+    pending = {} # future -> (source_path, filename, target_path, action_time, print_source)
+    
+    # bucket -> formatted TIME_SUBDIR_FORMAT; kept on interval_copy_files so it survives between runs
+    time_sub_cache = interval_copy_files.time_sub_cache
+    if len(time_sub_cache) > TIME_SUB_CACHE_LIMIT:
+        time_sub_cache.clear()
+    
+    copy_executor = concurrent.futures.ThreadPoolExecutor(max_workers=COPY_WORKERS)
+    # Hot-loop locals: avoid attribute lookups per file (normcase is a no-op off Windows)
+    path_join = os.path.join
+    normcase = os.path.normcase if IS_WINDOWS else None
+    submit = copy_executor.submit
+    time_time = time.time
+    # Log timestamps have second resolution, so format each second only once
+    last_sec = -1
+    action_time = ''
+    
+    try:
         try:
-            for root, dirs, files in os.walk(source_dir_norm):
+            for entry, rel_sub_path in _scan_tree(source_dir_norm):
+                filename = entry.name
+                source_path = entry.path
                 
-                # --- Relative Path Calculation ---
-                if root == source_dir_norm:
-                    rel_sub_path = '.'
-                else:
-                    root_norm = os.path.normpath(root)
-                    if root_norm.startswith(source_base_prefix):
-                        rel_sub_path = root_norm[len(source_base_prefix):]
-                    else:
-                        rel_sub_path = os.path.relpath(root_norm, source_dir_norm)
-                        if rel_sub_path.startswith('..'):
-                            rel_sub_path = root_norm[len(source_dir_norm):].lstrip(os.sep)
-                            if not rel_sub_path: rel_sub_path = '.'
-                # --- End Relative Path Calculation ---
-                
-                for filename in files:
-                    source_path = os.path.join(root, filename)
-                    
-                    if not any(filename.endswith(p[1:]) for p in patterns):
-                         continue
+                name_for_match = normcase(filename) if normcase else filename
+                # One scan: without a dot this yields the last character, which never equals a '.ext' suffix
+                ext = name_for_match[name_for_match.rfind('.'):]
+                if ext not in suffix_set and not (glob_re and glob_re.match(name_for_match)):
+                     continue
+
+                # Log rows are tuples: (source folder, file name, target absolute path, action date/time, status / error message)
+                sec = int(time_time())
+                if sec != last_sec:
+                    action_time = time.strftime(TIME_FORMAT, time.localtime(sec))
+                    last_sec = sec
+                target_path = 'N/A' 
 
-                    # Log entry template: [source folder, file name, target absolute path, action date/time, status / error message]
-                    log_entry = [source_path, filename, "", datetime.now().strftime(TIME_FORMAT), ""]
-                    target_path = 'N/A' 
+                try:
+                    entry_stat = entry.stat() # DirEntry caches the stat result
+                    mod_timestamp = entry_stat.st_mtime
+                    bucket = int(mod_timestamp // TIME_BUCKET_SECONDS)
+                    final_target_dir = target_dir_cache.get((bucket, rel_sub_path))
+                    if final_target_dir is None:
+                        time_sub_dir = time_sub_cache.get(bucket)
+                        if time_sub_dir is None:
+                            time_sub_dir = datetime.fromtimestamp(mod_timestamp).strftime(TIME_SUBDIR_FORMAT)
+                            time_sub_cache[bucket] = time_sub_dir
+                        base_target_dir = path_join(source_target_root, time_sub_dir)
+                        # Files at the source root go straight into the time folder (no '/./' segment)
+                        final_target_dir = base_target_dir if rel_sub_path == '.' else path_join(base_target_dir, rel_sub_path)
+                        target_dir_cache[(bucket, rel_sub_path)] = final_target_dir
+                    target_path = path_join(final_target_dir, filename)
+                    
+                except Exception as e:
+                    # ERROR LOGGING
+                    error_msg = str(e).replace('\n', ' ')
+                    log_row((source_path, filename, target_path, action_time, f"ERROR: {error_msg}"))
 
-                    try:
-                        mod_timestamp = os.path.getmtime(source_path)
-                        mod_dt = datetime.fromtimestamp(mod_timestamp)
-                        time_sub_dir = mod_dt.strftime(TIME_SUBDIR_FORMAT)
-                        base_target_dir = os.path.join(target_dir, source_name, time_sub_dir)
-                        final_target_dir = os.path.join(base_target_dir, rel_sub_path)
-                        
-                        os.makedirs(final_target_dir, exist_ok=True)
-                        target_path = os.path.join(final_target_dir, filename)
-                        
-                        shutil.copy2(source_path, target_path) 
-                        
-                        # SUCCESS LOGGING
-                        log_entry[2] = target_path
-                        log_entry[4] = "SUCCESS"
-                        write_log_entry(log_entry, log_history_deque, app_instance)
-                        
-                        print_source = os.path.join(rel_sub_path, filename) if rel_sub_path != '.' else filename
-                        print(f"  - Copied: {print_source} -> {target_path}")
-                        
-                        copied_from_source += 1
-                        total_copied_count += 1
-                        
-                    except Exception as e:
-                        # ERROR LOGGING
-                        error_msg = str(e).replace('\n', ' ')
-                        log_entry[2] = target_path
-                        log_entry[4] = f"ERROR: {error_msg}"
-                        write_log_entry(log_entry, log_history_deque, app_instance)
-
-                        print(f"  - ERROR processing {source_path}: {error_msg}")
-            
+                    print(f"  - ERROR processing {source_path}: {error_msg}")
+                    continue
+                
+                print_source = path_join(rel_sub_path, filename) if rel_sub_path != '.' else filename
+                future = submit(_copy_one, source_path, final_target_dir, target_path, entry_stat.st_size, mod_timestamp, created_dirs)
+                pending[future] = (source_path, filename, target_path, action_time, print_source)
+                
+                # Bound the number of queued copies so a huge tree is not held in memory
+                if len(pending) >= COPY_QUEUE_LIMIT:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        outcomes[_log_copy_result(future, *pending.pop(future), log_row)] += 1
+        
         except PermissionError as pe:
              print(f"  [CRITICAL] PERMISSION ERROR: Cannot read directory {source_dir_norm}. Error: {pe}")
         except FileNotFoundError as fnfe:
              print(f"  [CRITICAL] FILE NOT FOUND ERROR: Source directory {source_dir_norm} disappeared during walk. Error: {fnfe}")
         except Exception as e_walk:
-             print(f"  [CRITICAL] UNEXPECTED ERROR during os.walk on {source_dir_norm}: {e_walk}")
+             print(f"  [CRITICAL] UNEXPECTED ERROR while scanning {source_dir_norm}: {e_walk}")
+        
+        # Wait for the remaining copies so the count is complete
+        for future in concurrent.futures.as_completed(list(pending)):
+            outcomes[_log_copy_result(future, *pending.pop(future), log_row)] += 1
+    
+    finally:
+        copy_executor.shutdown(wait=True)
 
+    print(f"  > Done processing all files in {source_dir_norm}. Files copied: {outcomes['copied']}, unchanged (skipped): {outcomes['skipped']}")
+    return outcomes['copied']
 
-        print(f"  > Done processing all files in {source_dir_norm}. Files copied: {copied_from_source}")
+def _copy_source_task(args):
+    """
+    Process-pool entry point for one source directory. Log rows are collected and
+    returned as (copied_count, log_rows) so the parent writes the CSV and GUI history.
+    """
+    global LOG_SKIPPED, VERBOSE
+    source_dir, target_dir, suffix_set, glob_re, LOG_SKIPPED, VERBOSE = args # Spawned workers do not inherit config globals
+    log_rows = []
+    copied = _copy_source(source_dir, target_dir, suffix_set, glob_re, log_rows.append)
+    return copied, log_rows
+
+def interval_copy_files(source_dirs_str, target_dir, file_patterns, log_history_deque=None, app_instance=None):
+    """
+    Core function to copy files recursively and log the output.
+    Takes optional log_history_deque and app_instance for GUI integration.
+    Copies run on a thread pool; with several sources on a multi-core host, each source
+    is handled by its own worker process (imap_unordered) and its log rows are written here.
+    """
+    source_dirs = [d.strip() for d in source_dirs_str.split(';') if d.strip()]
+    
+    if not source_dirs:
+        print(f"[{datetime.now().strftime(TIME_FORMAT)}] WARNING: No source directories configured. Skipping copy.")
+        return
+
+    patterns = [p.strip() for p in file_patterns.split(';') if p.strip()]
+    suffix_set, glob_re = _compile_patterns(patterns)
+    total_copied_count = 0
+    target_dir = os.path.normpath(os.path.abspath(target_dir))
+    
+    def log_row(log_entry):
+        write_log_entry(log_entry, log_history_deque, app_instance)
+    
+    try:
+        process_count = min(len(source_dirs), os.cpu_count() or 1)
+        if process_count > 1:
+            job_args = [(source_dir, target_dir, suffix_set, glob_re, LOG_SKIPPED, VERBOSE) for source_dir in source_dirs]
+            with multiprocessing.Pool(process_count) as pool:
+                for copied, log_rows in pool.imap_unordered(_copy_source_task, job_args):
+                    total_copied_count += copied
+                    for log_entry in log_rows:
+                        log_row(log_entry)
+        else:
+            for source_dir in source_dirs:
+                total_copied_count += _copy_source(source_dir, target_dir, suffix_set, glob_re, log_row)
+    
+    finally:
+        flush_log_buffer()
 
     print(f"[{datetime.now().strftime(TIME_FORMAT)}] Copy run complete. Total files copied: {total_copied_count}")
 
+interval_copy_files.time_sub_cache = {}
+
 # --- CLI Mode Implementation ---
 
 def run_cli_mode():
@@ -306,7 +638,9 @@ def run_cli_mode():
     while True:
         try:
             schedule.run_pending()
-            time.sleep(1)
+            # Sleep until the next job is due (capped so the loop still wakes up regularly)
+            idle = schedule.idle_seconds()
+            time.sleep(max(0.1, min(idle if idle is not None else MAX_IDLE_SLEEP_SECONDS, MAX_IDLE_SLEEP_SECONDS)))
         except KeyboardInterrupt:
             print("\n" + "=" * 50)
             print(f"[{datetime.now().strftime(TIME_FORMAT)}] Scheduler stopped by user (Ctrl+C).")
@@ -317,240 +651,10 @@ def run_cli_mode():
             time.sleep(5)
 
 
-# --- GUI Logic (tkinter) ---
-
-def run_gui():
-    """Initializes and runs the tkinter GUI."""
-    
-    try:
-        import tkinter as tk
-        from tkinter import filedialog, messagebox
-        from tkinter.scrolledtext import ScrolledText 
-        from tkinter import ttk # REQUIRED FOR Treeview
-    except ImportError:
-        print("ERROR: tkinter or tkinter.ttk is required for the GUI mode but could not be imported.")
-        print("Please ensure your Python installation includes tkinter.")
-        sys.exit(1)
-
-    class App(tk.Frame):
-        def __init__(self, master=None):
-            super().__init__(master)
-            self.master = master
-            self.master.title("Interval File Copy Utility (Multi-Source, Logged)")
-            self.pack(padx=10, pady=10, fill=tk.BOTH, expand=True) # Allow frame to expand
-            
-            self.config = load_config()
-            self.job = None 
-            self.is_running = False
-            
-            # Deque for log history, initialized once
-            self.log_history = LOG_HISTORY 
-            
-            self.create_widgets()
-            self.load_settings()
-            
-            # Initial load of any existing log data is complex, so we start the GUI log empty.
-
-        def create_widgets(self):
-            # Configure grid weights to allow resizing
-            self.master.grid_columnconfigure(0, weight=1)
-            self.master.grid_rowconfigure(0, weight=1)
-            self.grid_columnconfigure(1, weight=1)
-            self.grid_rowconfigure(8, weight=1) # Row for the treeview
-
-            # --- Settings Section ---
-            # Row 0: Source Dirs
-            tk.Label(self, text=f"Source Dirs (1 per line or ; separated, use '{PATH_SEP_HINT}'):").grid(row=0, column=0, sticky="nw", pady=2)
-            self.source_text = ScrolledText(self, width=60, height=4)
-            self.source_text.grid(row=0, column=1, columnspan=2, pady=2, sticky="ew")
-            
-            # Row 1: Target Directory
-            tk.Label(self, text=f"Target Root Dir (use '{PATH_SEP_HINT}'):").grid(row=1, column=0, sticky="w", pady=2)
-            self.target_var = tk.StringVar()
-            tk.Entry(self, textvariable=self.target_var, width=60).grid(row=1, column=1, pady=2, sticky="ew")
-            tk.Button(self, text="Browse", command=lambda: self.browse_dir(self.target_var)).grid(row=1, column=2, padx=5, pady=2)
-
-            # Row 2: Interval
-            tk.Label(self, text="Interval (minutes):").grid(row=2, column=0, sticky="w", pady=2)
-            self.interval_var = tk.StringVar()
-            tk.Entry(self, textvariable=self.interval_var, width=10).grid(row=2, column=1, sticky="w", pady=2)
-            
-            # Row 3: File Patterns
-            tk.Label(self, text="File Patterns (*.ext;...):").grid(row=3, column=0, sticky="w", pady=2)
-            self.patterns_var = tk.StringVar()
-            tk.Entry(self, textvariable=self.patterns_var, width=60).grid(row=3, column=1, pady=2, sticky="ew")
-
-            # Row 4: Control Buttons
-            self.control_button_var = tk.StringVar(value="Start Copy")
-            self.control_button = tk.Button(self, textvariable=self.control_button_var, command=self.toggle_copy_job)
-            self.control_button.grid(row=4, column=0, columnspan=3, pady=10)
-            
-            # Row 5: Save Settings
-            tk.Button(self, text="Save Settings", command=self.save_settings).grid(row=5, column=0, columnspan=3, pady=5)
-            
-            # Row 6: Status
-            self.status_var = tk.StringVar(value="Status: Ready")
-            tk.Label(self, textvariable=self.status_var).grid(row=6, column=0, columnspan=3, sticky="w", pady=5)
-            
-            # --- Treeview Display Section ---
-            
-            # Row 7: Log Header
-            tk.Label(self, text=f"Last {LOG_HISTORY_LIMIT} Copy Events:").grid(row=7, column=0, columnspan=3, sticky="w", pady=5)
-            
-            # Frame for Treeview and Scrollbar
-            tree_frame = ttk.Frame(self)
-            tree_frame.grid(row=8, column=0, columnspan=3, sticky="nsew", padx=5, pady=5)
-            tree_frame.grid_rowconfigure(0, weight=1)
-            tree_frame.grid_columnconfigure(0, weight=1)
-
-            # Create Treeview
-            self.log_tree = ttk.Treeview(tree_frame, columns=TREE_COLUMNS, show='headings', height=10)
-            
-            # Configure Columns
-            self.log_tree.column("#0", width=0, stretch=tk.NO) # Hide the default Tree column
-            self.log_tree.column("Time", width=70, minwidth=60, stretch=tk.NO, anchor=tk.CENTER)
-            self.log_tree.column("File Name", width=150, minwidth=100, stretch=tk.YES)
-            self.log_tree.column("Source Path", width=250, minwidth=150, stretch=tk.YES)
-            self.log_tree.column("Target Path", width=250, minwidth=150, stretch=tk.YES)
-            self.log_tree.column("Status", width=120, minwidth=80, stretch=tk.YES)
-            
-            # Configure Headings
-            for col in TREE_COLUMNS:
-                self.log_tree.heading(col, text=col, anchor=tk.W)
-            
-            self.log_tree.grid(row=0, column=0, sticky="nsew")
-
-            # Add Scrollbar
-            vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.log_tree.yview)
-            self.log_tree.configure(yscrollcommand=vsb.set)
-            vsb.grid(row=0, column=1, sticky='ns')
-            
-            # Configure Style Tag for highlighting errors
-            style = ttk.Style(self)
-            style.configure("Error.Treeview", foreground="red")
-            
-        def browse_dir(self, var):
-            """Opens a directory selection dialog."""
-            directory = filedialog.askdirectory()
-            if directory:
-                var.set(directory)
-
-        def get_source_dirs_from_text(self):
-            """Converts the Text widget content into a semi-colon separated string."""
-            content = self.source_text.get("1.0", tk.END).strip()
-            source_dirs = ';'.join([d.strip() for line in content.splitlines() for d in line.split(';') if d.strip()])
-            return source_dirs
-
-        def load_settings(self):
-            """Loads settings from the loaded config object."""
-            settings = self.config['Settings']
-            self.source_text.delete("1.0", tk.END)
-            source_dirs_display = settings.get('source_dirs', '').replace(';', '\n')
-            self.source_text.insert("1.0", source_dirs_display)
-            
-            self.target_var.set(settings.get('target_dir', ''))
-            self.interval_var.set(settings.get('interval_minutes', '5'))
-            self.patterns_var.set(settings.get('file_patterns', '*.txt;*.log'))
-            
-        def save_settings(self):
-            """Collects and saves settings."""
-            try:
-                source_dirs_str = self.get_source_dirs_from_text()
-                target = self.target_var.get()
-                interval = int(self.interval_var.get())
-                patterns = self.patterns_var.get()
-                
-                if not all([source_dirs_str, target, interval > 0, patterns]):
-                    messagebox.showerror("Error", "All fields must be filled, and interval must be a positive number.")
-                    return
-
-                save_config(source_dirs_str, target, interval, patterns)
-                messagebox.showinfo("Success", f"Settings saved successfully to {CONFIG_FILE}.")
-                
-            except ValueError:
-                messagebox.showerror("Error", "Interval must be a valid number.")
-
-        def update_log_display(self):
-            """Clears and re-populates the Treeview with the current log_history."""
-            
-            # Clear existing items
-            for item in self.log_tree.get_children():
-                self.log_tree.delete(item)
-            
-            # Insert new items from the deque (which is already limited to 100)
-            for row in self.log_history:
-                # row is: [Time, File Name, Source Path, Target Path, Status]
-                
-                tags = ()
-                # Apply error highlighting tag
-                if row[4].startswith("ERROR"): 
-                    tags = ('Error',)
-                
-                # Insert row at the beginning (index 0)
-                self.log_tree.insert('', 0, values=row, tags=tags)
-                
-        def run_copy_wrapper(self):
-            """Wrapper for the copy function to run within the schedule."""
-            source_dirs_str = self.get_source_dirs_from_text()
-            target = self.target_var.get()
-            patterns = self.patterns_var.get()
-            
-            self.status_var.set(f"Status: Copying...")
-            self.master.update()
-            
-            # Pass the deque and self (App instance) to the core copy logic
-            interval_copy_files(source_dirs_str, target, patterns, self.log_history, self)
-            
-            self.status_var.set(f"Status: Running (Next in {self.interval_var.get()} min)")
-        
-        def toggle_copy_job(self):
-            """Starts or stops the scheduled copy job."""
-            
-            if self.is_running:
-                # Stop the job
-                schedule.clear(self.job)
-                self.is_running = False
-                self.control_button_var.set("Start Copy")
-                self.status_var.set("Status: Stopped")
-                print("Copy job stopped.")
-            else:
-                # Start the job
-                try:
-                    source_dirs_str = self.get_source_dirs_from_text()
-                    target = self.target_var.get()
-                    interval = int(self.interval_var.get())
-                    
-                    if not all([source_dirs_str, target, interval > 0]):
-                        messagebox.showerror("Error", "Please fill in valid Source(s), Target, and Interval fields first.")
-                        return
-
-                    # Run immediately, then schedule
-                    self.run_copy_wrapper() 
-                    self.job = schedule.every(interval).minutes.do(self.run_copy_wrapper)
-                    
-                    self.is_running = True
-                    self.control_button_var.set("Stop Copy")
-                    self.status_var.set(f"Status: Running (Next in {interval} min)")
-                    print(f"Copy job started, running every {interval} minutes.")
-                    
-                    self.master.after(1000, self.check_schedule) 
-                    
-                except ValueError:
-                    messagebox.showerror("Error", "Interval must be a valid number.")
-                
-        def check_schedule(self):
-            """Checks the schedule and runs pending jobs."""
-            if self.is_running:
-                schedule.run_pending()
-                self.master.after(1000, self.check_schedule) 
-
-    root = tk.Tk()
-    app = App(master=root)
-    root.mainloop()
-
 # --- Main Execution ---
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # Needed for the copy worker processes in a PyInstaller build
     
     parser = argparse.ArgumentParser(
         description=f"Interval File Copy Utility (Time: 2025-09-26 13:23:25 +07)",
@@ -566,7 +670,7 @@ if __name__ == "__main__":
     parser.add_argument(
         '--hiden-import', 
         action='store_true', 
-        help="Hint for PyInstaller: additional modules to include are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk'."
+        help="Hint for PyInstaller: additional modules to include are 'tkinter', 'configparser', 'schedule', 'os', 'shutil', 'time', 'datetime', 'csv', 'tkinter.ttk', 'ctypes', 'fnmatch', 're', 'concurrent.futures', 'multiprocessing'."
     )
     
     args = parser.parse_args()
@@ -574,5 +678,6 @@ if __name__ == "__main__":
     if args.cli:
         run_cli_mode()
     else:
-        # Default behavior: run GUI
-        run_gui()
\ No newline at end of file
+        # Default behavior: run GUI. Imported here so CLI mode never loads tkinter.
+        from secopy_gui import run_gui
+        run_gui(sys.modules[__name__])
\ No newline at end of file
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GUI mode for the Interval File Copy Utility (SECopy-tool.py).
+Only imported when the GUI is selected, so '--cli' runs never load tkinter
+(CLI-only builds can use PyInstaller '--exclude-module tkinter').
+"""
+
+import sys
+from collections import deque
+
+try:
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+    from tkinter.scrolledtext import ScrolledText 
+    from tkinter import ttk # REQUIRED FOR Treeview
+except ImportError:
+    print("ERROR: tkinter or tkinter.ttk is required for the GUI mode but could not be imported.")
+    print("Please ensure your Python installation includes tkinter.")
+    sys.exit(1)
+
+# --- GUI Logic (tkinter) ---
+
+class App(tk.Frame):
+    def __init__(self, master=None, core=None):
+        super().__init__(master)
+        self.master = master
+        self.core = core # The SECopy-tool module: config, copy logic and constants
+        self.master.title("Interval File Copy Utility (Multi-Source, Logged)")
+        self.pack(padx=10, pady=10, fill=tk.BOTH, expand=True) # Allow frame to expand
+        
+        self.config = self.core.load_config()
+        self.job = None 
+        self.is_running = False
+        
+        # Deque for log history, initialized once
+        self.log_history = self.core.LOG_HISTORY 
+        self._pending_refresh = False # A coalesced Treeview refresh is scheduled
+        self._newest_shown = None # Newest log_history row already in the Treeview
+        self._shown_iids = deque() # Treeview item ids, oldest (top) first
+        self._next_iid = 0 # Monotonic counter for stable Treeview item ids
+        
+        self.create_widgets()
+        self.load_settings()
+        
+        # Show today's most recent copies from the CSV log (only its tail is read)
+        if not self.log_history:
+            self.core.load_log_history(self.log_history)
+        self.update_log_display()
+
+    def create_widgets(self):
+        # Configure grid weights to allow resizing
+        self.master.grid_columnconfigure(0, weight=1)
+        self.master.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(8, weight=1) # Row for the treeview
+
+        # --- Settings Section ---
+        # Row 0: Source Dirs
+        tk.Label(self, text=f"Source Dirs (1 per line or ; separated, use '{self.core.PATH_SEP_HINT}'):").grid(row=0, column=0, sticky="nw", pady=2)
+        self.source_text = ScrolledText(self, width=60, height=4)
+        self.source_text.grid(row=0, column=1, columnspan=2, pady=2, sticky="ew")
+        
+        # Row 1: Target Directory
+        tk.Label(self, text=f"Target Root Dir (use '{self.core.PATH_SEP_HINT}'):").grid(row=1, column=0, sticky="w", pady=2)
+        self.target_var = tk.StringVar()
+        tk.Entry(self, textvariable=self.target_var, width=60).grid(row=1, column=1, pady=2, sticky="ew")
+        tk.Button(self, text="Browse", command=lambda: self.browse_dir(self.target_var)).grid(row=1, column=2, padx=5, pady=2)
+
+        # Row 2: Interval
+        tk.Label(self, text="Interval (minutes):").grid(row=2, column=0, sticky="w", pady=2)
+        self.interval_var = tk.StringVar()
+        tk.Entry(self, textvariable=self.interval_var, width=10).grid(row=2, column=1, sticky="w", pady=2)
+        
+        # Row 3: File Patterns
+        tk.Label(self, text="File Patterns (*.ext;...):").grid(row=3, column=0, sticky="w", pady=2)
+        self.patterns_var = tk.StringVar()
+        tk.Entry(self, textvariable=self.patterns_var, width=60).grid(row=3, column=1, pady=2, sticky="ew")
+
+        # Row 4: Control Buttons
+        self.control_button_var = tk.StringVar(value="Start Copy")
+        self.control_button = tk.Button(self, textvariable=self.control_button_var, command=self.toggle_copy_job)
+        self.control_button.grid(row=4, column=0, columnspan=3, pady=10)
+        
+        # Row 5: Save Settings
+        tk.Button(self, text="Save Settings", command=self.save_settings).grid(row=5, column=0, columnspan=3, pady=5)
+        
+        # Row 6: Status
+        self.status_var = tk.StringVar(value="Status: Ready")
+        tk.Label(self, textvariable=self.status_var).grid(row=6, column=0, columnspan=3, sticky="w", pady=5)
+        
+        # --- Treeview Display Section ---
+        
+        # Row 7: Log Header
+        tk.Label(self, text=f"Last {self.core.LOG_HISTORY_LIMIT} Copy Events:").grid(row=7, column=0, columnspan=3, sticky="w", pady=5)
+        
+        # Frame for Treeview and Scrollbar
+        tree_frame = ttk.Frame(self)
+        tree_frame.grid(row=8, column=0, columnspan=3, sticky="nsew", padx=5, pady=5)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+
+        # Create Treeview
+        self.log_tree = ttk.Treeview(tree_frame, columns=self.core.TREE_COLUMNS, show='headings', height=10)
+        
+        # Configure Columns
+        self.log_tree.column("#0", width=0, stretch=tk.NO) # Hide the default Tree column
+        self.log_tree.column("Time", width=70, minwidth=60, stretch=tk.NO, anchor=tk.CENTER)
+        self.log_tree.column("File Name", width=150, minwidth=100, stretch=tk.YES)
+        self.log_tree.column("Source Path", width=250, minwidth=150, stretch=tk.YES)
+        self.log_tree.column("Target Path", width=250, minwidth=150, stretch=tk.YES)
+        self.log_tree.column("Status", width=120, minwidth=80, stretch=tk.YES)
+        
+        # Configure Headings
+        for col in self.core.TREE_COLUMNS:
+            self.log_tree.heading(col, text=col, anchor=tk.W)
+        
+        self.log_tree.grid(row=0, column=0, sticky="nsew")
+
+        # Add Scrollbar
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.log_tree.yview)
+        self.log_tree.configure(yscrollcommand=vsb.set)
+        vsb.grid(row=0, column=1, sticky='ns')
+        
+        # Configure Style Tag for highlighting errors
+        style = ttk.Style(self)
+        style.configure("Error.Treeview", foreground="red")
+        
+    def browse_dir(self, var):
+        """Opens a directory selection dialog."""
+        directory = filedialog.askdirectory()
+        if directory:
+            var.set(directory)
+
+    def get_source_dirs_from_text(self):
+        """Converts the Text widget content into a semi-colon separated string."""
+        content = self.source_text.get("1.0", tk.END).strip()
+        source_dirs = ';'.join([d.strip() for line in content.splitlines() for d in line.split(';') if d.strip()])
+        return source_dirs
+
+    def load_settings(self):
+        """Loads settings from the loaded config object."""
+        settings = self.config['Settings']
+        self.source_text.delete("1.0", tk.END)
+        source_dirs_display = settings.get('source_dirs', '').replace(';', '\n')
+        self.source_text.insert("1.0", source_dirs_display)
+        
+        self.target_var.set(settings.get('target_dir', ''))
+        self.interval_var.set(settings.get('interval_minutes', '5'))
+        self.patterns_var.set(settings.get('file_patterns', '*.txt;*.log'))
+        
+    def save_settings(self):
+        """Collects and saves settings."""
+        try:
+            source_dirs_str = self.get_source_dirs_from_text()
+            target = self.target_var.get()
+            interval = int(self.interval_var.get())
+            patterns = self.patterns_var.get()
+            
+            if not all([source_dirs_str, target, interval > 0, patterns]):
+                messagebox.showerror("Error", "All fields must be filled, and interval must be a positive number.")
+                return
+
+            self.core.save_config(source_dirs_str, target, interval, patterns)
+            messagebox.showinfo("Success", f"Settings saved successfully to {self.core.CONFIG_FILE}.")
+            
+        except ValueError:
+            messagebox.showerror("Error", "Interval must be a valid number.")
+
+    def update_log_display(self):
+        """Schedules one Treeview refresh; calls within LOG_REFRESH_MS are coalesced."""
+        if self._pending_refresh:
+            return
+        self._pending_refresh = True
+        self.master.after(self.core.LOG_REFRESH_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Appends the rows logged since the last refresh and drops rows evicted from log_history."""
+        self._pending_refresh = False
+        
+        # log_history is newest-first; everything before the previously newest row is new
+        new_rows = []
+        for row in self.log_history:
+            if row is self._newest_shown:
+                break
+            new_rows.append(row)
+        if not new_rows:
+            return
+        
+        # Oldest rows stay at the top, so new rows go to the end in chronological order
+        for row in reversed(new_rows):
+            # row is: [Time, File Name, Source Path, Target Path, Status]
+            
+            tags = ()
+            # Apply error highlighting tag
+            if row[4].startswith("ERROR"): 
+                tags = ('Error',)
+            
+            self._next_iid += 1
+            iid = str(self._next_iid)
+            self.log_tree.insert('', 'end', iid=iid, values=row, tags=tags)
+            self._shown_iids.append(iid)
+        self._newest_shown = new_rows[0]
+        
+        # Keep the tree limited to what the deque still holds; the oldest ids are at the left
+        excess = len(self._shown_iids) - len(self.log_history)
+        if excess > 0:
+            self.log_tree.delete(*[self._shown_iids.popleft() for _ in range(excess)])
+            
+    def run_copy_wrapper(self):
+        """Wrapper for the copy function to run within the schedule."""
+        source_dirs_str = self.get_source_dirs_from_text()
+        target = self.target_var.get()
+        patterns = self.patterns_var.get()
+        
+        self.status_var.set(f"Status: Copying...")
+        self.master.update()
+        
+        # Pass the deque and self (App instance) to the core copy logic
+        self.core.interval_copy_files(source_dirs_str, target, patterns, self.log_history, self)
+        
+        self.status_var.set(f"Status: Running (Next in {self.interval_var.get()} min)")
+    
+    def toggle_copy_job(self):
+        """Starts or stops the scheduled copy job."""
+        
+        if self.is_running:
+            # Stop the job
+            self.core.schedule.clear(self.job)
+            self.is_running = False
+            self.control_button_var.set("Start Copy")
+            self.status_var.set("Status: Stopped")
+            print("Copy job stopped.")
+        else:
+            # Start the job
+            try:
+                source_dirs_str = self.get_source_dirs_from_text()
+                target = self.target_var.get()
+                interval = int(self.interval_var.get())
+                
+                if not all([source_dirs_str, target, interval > 0]):
+                    messagebox.showerror("Error", "Please fill in valid Source(s), Target, and Interval fields first.")
+                    return
+
+                # Run immediately, then schedule
+                self.run_copy_wrapper() 
+                self.job = self.core.schedule.every(interval).minutes.do(self.run_copy_wrapper)
+                
+                self.is_running = True
+                self.control_button_var.set("Stop Copy")
+                self.status_var.set(f"Status: Running (Next in {interval} min)")
+                print(f"Copy job started, running every {interval} minutes.")
+                
+                self.master.after(1000, self.check_schedule) 
+                
+            except ValueError:
+                messagebox.showerror("Error", "Interval must be a valid number.")
+            
+    def check_schedule(self):
+        """Checks the schedule and runs pending jobs."""
+        if self.is_running:
+            self.core.schedule.run_pending()
+            # No countdown is shown, so only wake up when the next job is due
+            idle = self.core.schedule.idle_seconds()
+            delay_sec = min(max(idle if idle is not None else 1, 0.2), self.core.MAX_IDLE_SLEEP_SECONDS)
+            self.master.after(int(delay_sec * 1000), self.check_schedule)
+
+def run_gui(core):
+    """Initializes and runs the tkinter GUI. core is the SECopy-tool module."""
+    root = tk.Tk()
+    app = App(master=root, core=core)
+    root.mainloop()